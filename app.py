@@ -1,8 +1,7 @@
 import os
 import uuid
-import re
 import json
-import unicodedata
+import threading
 from pathlib import Path
 
 import pandas as pd
@@ -12,12 +11,42 @@ from flask import (
     request, 
     jsonify, 
     url_for, 
-    session
+    session,
+    Response,
+    stream_with_context
 )
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from mapping import chatbot_logic, handle_chat
 from mapping.chatbot.dataset_loader import load_chatbot_dataset
+from mapping.ingredient_mapping.ingredient_synonyms import INGREDIENT_SYNONYMS
+from catalog import CatalogStore, clean_text, tokenize
+from catalog.bitmap import category_filter_key
+from catalog.fuzzy import MAX_RESULTS as FUZZY_MAX_RESULTS
+from catalog.serialize import frame_records, flag_values, safety_scores
+from catalog.suggest import build_suggest_index, DEFAULT_SUGGESTIONS
+from catalog.matcher import KeywordMatcher
+from web import (
+    encode_cursor,
+    decode_cursor,
+    keyset_page,
+    InvalidCursor,
+    ResponseCache,
+    cached_response,
+    conditional_get,
+    SHORT_LIVED,
+    make_json_provider,
+    json_provider_name,
+    compress_response,
+    EXPORT_FORMATS,
+    iter_chunks,
+    ndjson_stream,
+    csv_stream,
+    ImageManifestStore,
+    init_static_assets,
+    precompress_static,
+    generate_thumbnails
+)
 
 STATE_MEMORY = {}
 USER_MEMORY = STATE_MEMORY
@@ -59,103 +88,70 @@ app.wsgi_app = ProxyFix(
     x_port=1, 
     x_prefix=1
 )
+# jsonify pakai orjson kalau terpasang (fallback encoder bawaan Flask)
+app.json = make_json_provider(app)
+print(f"[JSON] provider: {json_provider_name()}")
+# Body JSON/HTML besar dikompres gzip/br sesuai Accept-Encoding
+app.after_request(compress_response)
+
+@app.cli.command("precompress-static")
+def precompress_static_command():
+    """Buat sibling .gz/.br untuk CSS/JS/JSON static (jalankan saat build/deploy)."""
+    for rel, before, after in precompress_static(STATIC_DIR):
+        print(f"[ASSETS] {rel}: {before} → {after} byte")
+
+def build_thumbnails():
+    stats = generate_thumbnails(STATIC_DIR / "images", workers=int(os.getenv("SKINALYZE_THUMB_WORKERS", "0") or 0))
+    if stats.get("error"):
+        print(f"[THUMBS] Dilewati: {stats['error']} Card tetap pakai gambar asli.")
+    else:
+        print(f"[THUMBS] {stats['generated']} dibuat, {stats['removed']} dihapus, "
+              f"{stats['bytes'] / 1024:.0f} KB, {stats['workers']} worker")
+    return stats
+
+@app.cli.command("thumbnails")
+def thumbnails_command():
+    """Buat thumbnail 160/320/640 gambar produk (incremental, paralel per core)."""
+    build_thumbnails()
 
 # -------------------------
-# Util Dataset
+# Load Dataset (Catalog)
 # -------------------------
-def normalize_key(text: str) -> str:
-    return normalize_filename(text).lower()
-
-def normalize_filename(name: str) -> str:
-    name = name.lower().strip()
-    name = name.replace(" ", "_")
-    name = re.sub(r"[+]+", "", name)   # HAPUS +++
-    name = re.sub(r"[^a-z0-9_]", "", name)  # HAPUS karakter aneh
-    name = re.sub(r"_+", "_", name)
-    return name
-
-def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    # bersihkan nama kolom (strip) lalu rename beberapa variasi ke nama kolom standar
-    cols = {c: c.strip() for c in df.columns}
-    df = df.rename(columns=cols)
-
-    # Lower-case map detection
-    colmap = {}
-    for c in df.columns:
-        lc = c.lower()
-        if "nama" in lc and "produk" in lc:
-            colmap[c] = "Nama Produk"
-        elif lc == "name" or lc == "nama":
-            colmap[c] = "Nama Produk"
-        elif "brand" in lc:
-            colmap[c] = "Brand"
-        elif "kandung" in lc or "kandungan" in lc:
-            colmap[c] = "Kandungan Utama"
-        elif "gambar" in lc or lc == "image" or lc == "images":
-            colmap[c] = "Gambar"
-        elif "jenis" in lc and "kulit" in lc:
-            colmap[c] = "Jenis Kulit"
-        elif "masalah" in lc:
-            colmap[c] = "Masalah Kulit"
-        elif "score" in lc:
-            colmap[c] = "Score"
-        elif "catat" in lc or "note" in lc:
-            colmap[c] = "Catatan"
-        elif "alcohol" in lc:
-            colmap[c] = "Alcohol-Free"
-        elif "fragrance" in lc or "parfum" in lc:
-            colmap[c] = "Fragrance-Free"
-        elif "comed" in lc or ("non" in lc and "comedo" in lc):
-            colmap[c] = "Non-Comedogenic"
-
-    if colmap:
-        df = df.rename(columns=colmap)
-
-    for must in ["Nama Produk", "Brand", "Kandungan Utama", "Gambar", "Kategori", "Jenis Kulit", "Masalah Kulit"]:
-        if must not in df.columns:
-            df[must] = ""
-
-    for col in ["Alcohol-Free", "Fragrance-Free", "Non-Comedogenic"]:
-        if col in df.columns:
-            df[col] = df[col].astype(str).str.strip().str.lower().isin(["yes", "true", "1"])
-        else:
-            df[col] = False
+# Satu catalog per proses: web routes pakai DataFrame view,
+# chatbot pakai record view dari catalog yang sama.
+# Snapshot bisa di-reload (watcher / endpoint admin) tanpa restart;
+# tiap request ambil snapshot sekali lewat get_catalog().
+CATALOG_STORE = CatalogStore(DATASET_DIR)
 
-    return df
+def get_catalog():
+    return CATALOG_STORE.current()
 
-def load_all_datasets():
-    DATASET.clear()
-    if not DATASET_DIR.exists():
-        print("[DATASET] Folder dataset tidak ditemukan:", DATASET_DIR)
-        return
-    for fp in DATASET_DIR.glob("*.xlsx"):
-        if fp.name.startswith("~$"):  # skip temporary Excel file
-            continue
-        try:
-            df = pd.read_excel(fp, engine="openpyxl")
-            df.columns = df.columns.str.strip().str.lower()
-            df = normalize_dataframe(df)
-            key = normalize_key(fp.stem)
-
-            if "facial" in key: key = "facialwash"
-            elif "moist" in key: key = "moisturizer"
-            elif "serum" in key: key = "serum"
-            elif "sun" in key: key = "sunscreen"
-            elif "toner" in key: key = "toner"
-
-            df["Kategori"] = key
-            DATASET[key] = df
-            print(f"[DATASET] Muat: {fp.name} ({len(df)} baris) → key: {key}")
-        except Exception as e:
-            print(f"[DATASET] Gagal baca {fp.name}: {e}")
+# Cache response halaman/API katalog, key ikut versi catalog
+# (ukuran & TTL: SKINALYZE_RESPONSE_CACHE_SIZE / SKINALYZE_RESPONSE_CACHE_TTL, size 0 = mati)
+RESPONSE_CACHE = ResponseCache()
+
+# Manifest static/images: resolve gambar tanpa Path.exists() per produk,
+# scan ulang otomatis kalau isi folder berubah
+IMAGE_STORE = ImageManifestStore(STATIC_DIR / "images")
+
+# url_for('static') → nama file ber-hash + Cache-Control immutable
+# (matikan saat develop CSS/JS: SKINALYZE_STATIC_HASH=0).
+# Hash dibangun ulang kalau manifest gambar berubah (gambar/thumbnail baru).
+if os.getenv("SKINALYZE_STATIC_HASH", "1").strip().lower() not in ["0", "false", "no", "off"]:
+    init_static_assets(app, version_fn=lambda: IMAGE_STORE.current().version)
+
+def catalog_version():
+    # gambar ikut menentukan isi halaman → perubahan folder gambar juga membuang cache/ETag lama
+    return f"{get_catalog().version}-{IMAGE_STORE.current().version}"
+
+def load_all_datasets(force=False):
+    catalog, changed = CATALOG_STORE.reload(force=force)
+    return catalog, changed
 
-# -------------------------
-# Load Dataset
-# -------------------------
-DATASET = {}
 load_all_datasets()
 
-CHATBOT_DATASET = load_chatbot_dataset()
+if os.getenv("SKINALYZE_CATALOG_WATCH", "").strip().lower() in ["1", "true", "yes", "on"]:
+    CATALOG_STORE.start_watcher(float(os.getenv("SKINALYZE_CATALOG_WATCH_INTERVAL", "5")))
 
 # -------------------------
 # Load Models
@@ -170,7 +166,7 @@ def load_models():
     if not MODELS_DIR.exists():
         return
 
-    for key in DATASET.keys():
+    for key in get_catalog().keys():
         folder = MODEL_DIR_MAP.get(key)
         if not folder:
             continue
@@ -198,85 +194,89 @@ def load_models():
 # -------------------------
 # Flask init
 # -------------------------
-def get_image_path(kategori: str = "", nama_produk: str = "", image_col: str = "") -> str:
-    """Helper untuk mencari gambar yang fleksibel di Linux."""
-    # Gunakan folder 'images' (huruf kecil semua lebih aman di Linux)
-    base_images = STATIC_DIR / "images" 
+def image_srcset(card) -> str:
+    """Atribut srcset dari thumbnail card ("" kalau thumbnail belum dibuat)."""
+    return ", ".join(f"{url_for('static', filename=path)} {width}w" for path, width in card["thumbs"])
     
-    # 1. Cek dari kolom image di dataset
-    if image_col and str(image_col) != "nan":
-        img_path = Path(str(image_col)).as_posix()
-        if (base_images / img_path).exists():
-            return url_for('static', filename=f'images/{img_path}')
-
-    # 2. Cek berdasarkan kategori/nama_produk
-    if kategori and nama_produk:
-        kat_clean = kategori.lower().replace(" ", "")
-        prod_clean = nama_produk.strip().replace(" ", "_")
-        
-        exts = ['.png', '.jpg', '.jpeg', '.PNG', '.JPG']
-        for ext in exts:
-            fname = f"{kat_clean}/{prod_clean}{ext}"
-            if (base_images / fname).exists():
-                return url_for('static', filename=f'images/{fname}')
-
-    return url_for('static', filename='images/default.png')
-    
-def apply_filters(df, q="", brand="", prefs=None):
+def match_query(df, q):
+    q_lower = q.lower()
+    # proteksi bila kolom kosong; q dicocokkan sebagai teks biasa (bukan regex),
+    # jadi query seperti "(" atau "vit. c" tidak bikin error
+    mask1 = df.get("Nama Produk", "").astype(str).str.lower().str.contains(q_lower, na=False, regex=False)
+    mask2 = df.get("Kandungan Utama", "").astype(str).str.lower().str.contains(q_lower, na=False, regex=False)
+    return df[mask1 | mask2]
+
+def has_exact_match(df, q, fields, match, index=None) -> bool:
+    """
+    Ada produk di df yang cocok persis dengan q, sebelum filter facet (brand,
+    kategori, flag)? Fallback fuzzy cuma dipakai kalau search-nya sendiri
+    kosong — bukan kalau facet yang menyaring hasil search sampai habis.
+    """
+    if index is not None:
+        df = index.candidates(df, q, fields)
+    return not df.empty and not match(df, q).empty
+
+def apply_filters(df, q="", brand="", prefs=None, index=None, bitmaps=None, fuzzy=None):
+    base, brand_arg, prefs_arg = df, brand, prefs
+    if bitmaps is not None:
+        # brand + prefs + kandidat search di-resolve di level bitmap, baris diambil sekali
+        flags = [key for key, val in (prefs or {}).items() if val]
+        ids = index.lookup(q, ["Nama Produk", "Kandungan Utama"]) if q and index is not None else None
+        bits = bitmaps.query(brands=[brand.lower()] if brand else None, flags=flags, brand_facet="brand_lower", ids=ids)
+        df = bitmaps.select(df, bits)
+        brand, prefs = "", None
+    elif q and index is not None:
+        # index mempersempit kandidat dulu, cek substring tetap sama seperti lama
+        df = index.candidates(df, q, ["Nama Produk", "Kandungan Utama"])
     if q:
-        q_lower = q.lower()
-        # proteksi bila kolom kosong
-        mask1 = df.get("Nama Produk", "").astype(str).str.lower().str.contains(q_lower, na=False)
-        mask2 = df.get("Kandungan Utama", "").astype(str).str.lower().str.contains(q_lower, na=False)
-        df = df[mask1 | mask2]
+        df = match_query(df, q)
     if brand:
         df = df[df.get("Brand", "").astype(str).str.lower() == brand.lower()]
     if prefs:
         for key, val in prefs.items():
             if val and key in df.columns:
                 df = df[df[key] == True]
-    return df
 
-import re
-import unicodedata
-import pandas as pd
-
-def clean_text(s: str) -> str:
-    if not isinstance(s, str): return ""
-    s = s.lower()
-    s = unicodedata.normalize("NFKD", s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
-    return re.sub(r"\s+", " ", s).strip()
-
-
-def tokenize(s: str) -> set:
-    return set(clean_text(s).split())
+    # Search tidak menemukan apa pun → fallback fuzzy (typo), urut similarity
+    if q and fuzzy is not None and df.empty and not has_exact_match(
+            base, q, ["Nama Produk", "Kandungan Utama"], match_query, index):
+        ranked = fuzzy.rank(base, q, ["Nama Produk", "Kandungan Utama"], limit=FUZZY_MAX_RESULTS)
+        return apply_filters(ranked, brand=brand_arg, prefs=prefs_arg)
+    return df
 
-def match_problem(user_problem: str, dataset_problem: str, variants: list) -> bool:
+def problem_tokens(masalah_list: list) -> set:
     """
-    Matching versi baru:
-    - Clean text
-    - Token-by-token matching
-    - Tidak butuh regex
+    Kumpulan token yang membuat sebuah produk dianggap cocok
+    dengan salah satu masalah kulit user (OR logic).
     """
-    user_tokens = tokenize(user_problem)
-    dataset_tokens = tokenize(dataset_problem)
-
-    # Variant dibersihkan semua
-    variant_tokens = [tokenize(v) for v in variants]
-
-    # Jika dataset punya token yang ada di salah satu variant → match
-    for vt in variant_tokens:
-        for token in vt:
-            if token in dataset_tokens:
-                return True
+    needles = set()
+    for user_problem in masalah_list:
+        user_tokens = set(tokenize(user_problem))
+        matched_master = None
+
+        # TIPE A — exact alias
+        for master, variants in SKIN_MAP.items():
+            if user_problem in [clean_text(v) for v in variants]:
+                matched_master = master
+                break
+
+        # TIPE B — token matching
+        if matched_master is None:
+            for master, variants in SKIN_MAP.items():
+                for v in variants:
+                    if user_tokens & set(tokenize(v)):
+                        matched_master = master
+                        break
+                if matched_master:
+                    break
 
-    # fallback (jarang dipakai)
-    for ut in user_tokens:
-        if ut in dataset_tokens:
-            return True
+        # cocok kalau produk punya token dari variant master atau token user
+        if matched_master:
+            for v in SKIN_MAP[matched_master]:
+                needles |= tokenize(v)
+        needles |= user_tokens
 
-    return False
+    return needles
 
 
 CATEGORY_MAP = {
@@ -302,7 +302,10 @@ def recommend(category, jenis_kulit, masalah_kulit, prefs, top_k=10):
     if dataset_key is None:
         dataset_key = category  # fallback
 
-    df = DATASET.get(dataset_key, pd.DataFrame()).copy()
+    # satu snapshot untuk seluruh proses rekomendasi (aman saat reload)
+    catalog = get_catalog()
+    # tabel produk unik (bukan baris per jenis kulit) → tidak perlu drop_duplicates
+    df = catalog.product_frame(dataset_key).copy()
     if df.empty:
         print("DATAFRAME KOSONG UNTUK:", dataset_key)
         return []
@@ -310,10 +313,12 @@ def recommend(category, jenis_kulit, masalah_kulit, prefs, top_k=10):
     # ======================
     # NORMALISASI JENIS KULIT
     # ======================
+    # Kolom __*_norm / __*_tokens sudah dihitung sekali saat catalog di-load,
+    # jenis kulit dicocokkan lewat tabel mapping produk → jenis kulit
     if jenis_kulit:
         jk_clean = clean_text(jenis_kulit)
-        df["__jenis_norm"] = df["Jenis Kulit"].astype(str).apply(clean_text)
-        df = df[df["__jenis_norm"].str.contains(jk_clean, na=False)]
+        skin_ids = catalog.schema.skin_ids_containing(jk_clean)
+        df = df[df.index.isin(catalog.schema.product_ids_for_skins(skin_ids))]
     
     # ======================
     # HARD FILTER KANDUNGAN (WAJIB ADA)
@@ -321,9 +326,7 @@ def recommend(category, jenis_kulit, masalah_kulit, prefs, top_k=10):
     if prefs and "ingredient" in prefs:
         ing = clean_text(prefs["ingredient"])
 
-        df["__kandungan_norm"] = df["Kandungan Utama"].astype(str).apply(clean_text)
-
-        df = df[df["__kandungan_norm"].str.contains(ing, na=False)]
+        df = df[df["__kandungan_norm"].str.contains(ing, na=False, regex=False)]
 
         # kalau setelah hard filter kosong → langsung return
         if df.empty:
@@ -341,48 +344,14 @@ def recommend(category, jenis_kulit, masalah_kulit, prefs, top_k=10):
     # MATCH MASALAH KULIT (MULTI - OR LOGIC)
     # ======================
     if masalah_list:
-        df["__m_norm"] = df["Masalah Kulit"].astype(str).apply(clean_text)
-
-        def cocok_dengan_salah_satu(dataset_problem):
-            for user_problem in masalah_list:
-                user_tokens = set(tokenize(user_problem))
-                matched_master = None
-
-                # TIPE A — exact alias
-                for master, variants in SKIN_MAP.items():
-                    if user_problem in [clean_text(v) for v in variants]:
-                        matched_master = master
-                        break
-
-                # TIPE B — token matching
-                if matched_master is None:
-                    for master, variants in SKIN_MAP.items():
-                        for v in variants:
-                            if user_tokens & set(tokenize(v)):
-                                matched_master = master
-                                break
-                        if matched_master:
-                            break
-
-                # FILTER
-                if matched_master:
-                    if match_problem(
-                        user_problem=user_problem,
-                        dataset_problem=dataset_problem,
-                        variants=SKIN_MAP[matched_master]
-                    ):
-                        return True
-                else:
-                    if any(t in dataset_problem.split() for t in user_tokens):
-                        return True
-
-            return False
-
-        df = df[df["__m_norm"].apply(cocok_dengan_salah_satu)]
+        # Token yang dicari cuma bergantung ke input user,
+        # jadi dihitung sekali lalu dicocokkan ke token set tiap produk.
+        needles = problem_tokens(masalah_list)
+        df = df[~df["__m_tokens"].map(needles.isdisjoint)]
 
         # fallback aman
         if df.empty:
-            df = DATASET.get(dataset_key, pd.DataFrame()).copy()
+            df = catalog.product_frame(dataset_key).copy()
 
     # ======================
     # FILTER TAMBAHAN (PREFS DARI USER)
@@ -416,78 +385,42 @@ def recommend(category, jenis_kulit, masalah_kulit, prefs, top_k=10):
     if df.empty:
         return []
 
-    #======================
-    # 1. HAPUS DUPLIKASI SEBELUM RETURN
-    # ======================
-    # Asumsi: 'Nama Produk' dan 'Brand' adalah penentu unik
-    df = df.drop_duplicates(subset=["Nama Produk", "Brand"], keep="first")
-
     # ==========================================
-    # 2. HITUNG SKOR KEAMANAN (Safety Score)
+    # 1. HITUNG SKOR KEAMANAN (Safety Score)
     # ==========================================
     # Produk yang bebas alkohol, fragrance, & non-comedogenic dapat skor tertinggi (3)
-    def calculate_safety_score(row):
-        score = 0
-        if row.get("Alcohol-Free") is True: score += 1
-        if row.get("Fragrance-Free") is True: score += 1
-        if row.get("Non-Comedogenic") is True: score += 1
-        return score
-
-    df["safety_score"] = df.apply(calculate_safety_score, axis=1)
+    # (dihitung per kolom, bukan apply per baris)
+    df["safety_score"] = safety_scores(df, ["Alcohol-Free", "Fragrance-Free", "Non-Comedogenic"])
 
     # ==========================================
-    # 3. PENGACAKAN & PENGURUTAN
+    # 2. PENGACAKAN & PENGURUTAN
     # ==========================================
     # Diacak dulu (agar urutan brand tidak membosankan), 
     # lalu diurutkan berdasarkan skor keamanan tertinggi ke terendah.
-    df = df.sample(frac=1).sort_values(by="safety_score", ascending=False).reset_index(drop=True)
+    # index (product_id) dipertahankan untuk ambil card yang sudah dihitung
+    df = df.sample(frac=1).sort_values(by="safety_score", ascending=False)
 
     # ==========================================
-    # 4. FILTER MAKSIMAL 1 PRODUK PER BRAND
+    # 3. FILTER MAKSIMAL 1 PRODUK PER BRAND
     # ==========================================
     results = []
     brand_counts = {}
+    cards = product_cards(catalog)
 
-    for _, r in df.iterrows():
+    for product_id in df.index:
         # Berhenti jika sudah mencapai jumlah yang diminta (misal 7)
         if len(results) >= top_k:
             break
-            
-        row = r.to_dict()
-        brand_name = row.get("Brand", "Unknown")
+
+        card = cards[product_id]
+        brand_name = card["brand"]
 
         # LOGIKA INTI: Jika brand ini sudah ada di daftar, lewati cari brand lain
         if brand_counts.get(brand_name, 0) >= 1:
             continue
 
-        # ---- PROSES NOTES (Peringatan Otomatis) ----
-        notes = []
-        if not bool(row.get("Fragrance-Free")):
-            notes.append("Produk ini mengandung fragrance, sebaiknya dihindari jika kulit sangat sensitif.")
-        if not bool(row.get("Alcohol-Free")):
-            notes.append("Produk ini mengandung alkohol, perhatikan bila kulit mudah kering atau iritasi.")
-        if not bool(row.get("Non-Comedogenic")):
-            notes.append("Produk ini berpotensi comedogenic, kurang cocok jika mudah berjerawat.")
-        
-        # Tambahkan catatan manual dari dataset jika ada
-        if row.get("Catatan") and str(row.get("Catatan")).lower() != "nan":
-            notes.append(str(row.get("Catatan")).strip())
-
-        results.append({
-            "nama": row.get("Nama Produk", ""),
-            "brand": row.get("Brand", ""),
-            "kategori": row.get("Kategori", ""),
-            "kandungan": row.get("Kandungan Utama", ""),
-            "image_url": get_image_path(
-                row.get("Kategori", "").strip(),
-                row.get("Nama Produk", "").strip(),
-                row.get("Gambar") or row.get("image") or ""
-            ),
-            "alcohol_free": bool(row.get("Alcohol-Free")),
-            "fragrance_free": bool(row.get("Fragrance-Free")),
-            "non_comedogenic": bool(row.get("Non-Comedogenic")),
-            "note": notes
-        })
+        # Catatan (peringatan otomatis + catatan dataset) sudah dihitung di card
+        results.append(recommend_item(card))
 
         # Tandai bahwa brand ini sudah diambil
         brand_counts[brand_name] = 1
@@ -521,13 +454,16 @@ load_skin_mapping()
 # -------------------------
 @app.before_request
 def init_session_id():
+    # file static (immutable, boleh di-cache bersama) tidak boleh membawa cookie per user
+    if request.endpoint == "static":
+        return
 
     if "user_id" not in session:
         session["user_id"] = str(uuid.uuid4())
 
 @app.after_request
 def add_chat_uid_cookie(response):
-    if "chat_uid" not in request.cookies:
+    if request.endpoint != "static" and "chat_uid" not in request.cookies:
  
         response.set_cookie("chat_uid", str(uuid.uuid4()), max_age=30*24*3600)
     return response
@@ -547,10 +483,13 @@ def reset_chatbot():
 # ROUTES
 # -------------------------
 @app.route("/")
+@cached_response(RESPONSE_CACHE, catalog_version)
 def page_home():
-    all_df = pd.concat(list(DATASET.values())) if DATASET else pd.DataFrame()
-    brands = sorted(all_df["Brand"].dropna().unique().tolist()) if "Brand" in all_df.columns else []
-    categories = sorted(all_df["Kategori"].dropna().unique().tolist()) if "Kategori" in all_df.columns else []
+    catalog = get_catalog()
+    # frame gabungan + daftar brand/kategori sudah dibangun sekali per versi catalog
+    all_df = catalog.listing_frame()
+    brands = catalog.brand_list()
+    categories = catalog.category_list()
 
     # Ambil parameter filter
     search = request.args.get("search")
@@ -560,9 +499,7 @@ def page_home():
     fragrance_free = request.args.get("fragrance_free") == "true"
     non_comedogenic = request.args.get("non_comedogenic") == "true"
 
-    if "Brand" in all_df.columns:
-        all_df["Brand"] = all_df["Brand"].astype(str).str.strip().str.upper()
-        selected_brands = [b.upper() for b in selected_brands]
+    selected_brands = [b.strip().upper() for b in selected_brands]
 
 
     # Apply filter
@@ -573,38 +510,20 @@ def page_home():
         categories=selected_categories,
         alcohol_free=alcohol_free,
         fragrance_free=fragrance_free,
-        non_comedogenic=non_comedogenic
+        non_comedogenic=non_comedogenic,
+        index=catalog.search_index(),
+        bitmaps=catalog.bitmap_index(),
+        fuzzy=catalog.trigram_index()
     )
 
-    # Hapus duplikat
-    df_filtered = df_filtered.drop_duplicates(subset=["Nama Produk"])
-
+    # listing_frame = tabel produk (1 baris per produk) → tidak perlu drop_duplicates per request
     # Fallback: kalau filter kosong, ambil default 6 produk
     if df_filtered.empty:
-        df_filtered = all_df.drop_duplicates(subset=["Nama Produk"]).head(6)
+        df_filtered = all_df.head(6)
 
-    # Ambil 6 produk pertama
-    items = []
-    for _, r in df_filtered.head(6).iterrows():
-        items.append({
-        "nama": r.get("Nama Produk", ""),
-        "brand": r.get("Brand", ""),
-        "kategori": r.get("Kategori", ""),
-        "kandungan": r.get("Kandungan Utama", ""),
-        "image_url": get_image_path(
-            r.get("Kategori", ""),
-            r.get("Nama Produk", ""),
-            r.get("Gambar") or r.get("image", "")
-        ),
-
-        "manfaat": generate_product_benefits(
-                r.get("Kandungan Utama", ""),
-                r.get("Kategori", "")
-        ),
-        "alcohol_free": str(r.get("Alcohol-Free", "")).strip().lower() == "yes",
-        "fragrance_free": str(r.get("Fragrance-Free", "")).strip().lower() == "yes",
-        "non_comedogenic": str(r.get("Non-Comedogenic", "")).strip().lower() == "yes",
-    })
+    # Ambil 6 produk pertama (card sudah dihitung per versi catalog)
+    cards = product_cards(catalog)
+    items = [page_item(cards[product_id]) for product_id in df_filtered.head(6).index]
 
     return render_template(
         "home.html",
@@ -617,16 +536,26 @@ def page_home():
         alcohol_free=alcohol_free,
         fragrance_free=fragrance_free,
         non_comedogenic=non_comedogenic,
+        facets=product_facets(
+            catalog,
+            search=search,
+            brands=selected_brands,
+            categories=selected_categories,
+            alcohol_free=alcohol_free,
+            fragrance_free=fragrance_free,
+            non_comedogenic=non_comedogenic
+        ),
         request=request
 )
 
 @app.route("/produk")
 @app.route("/produk/page/<int:page>")
+@cached_response(RESPONSE_CACHE, catalog_version)
 def page_produk(page=1):
-    all_df = pd.concat(list(DATASET.values())) if DATASET else pd.DataFrame()
-    print("DEBUG KATEGORI UNIQUE:", all_df["Kategori"].unique())
-    brands = sorted(all_df["Brand"].dropna().unique().tolist()) if "Brand" in all_df.columns else []
-    categories = sorted(all_df["Kategori"].dropna().unique().tolist()) if "Kategori" in all_df.columns else []
+    catalog = get_catalog()
+    all_df = catalog.listing_frame()
+    brands = catalog.brand_list()
+    categories = catalog.category_list()
 
     # Ambil filter dari request (query string)
     search = request.args.get("search")
@@ -642,8 +571,7 @@ def page_produk(page=1):
     "Non-Comedogenic": non_comedogenic,
 }
 
-    all_df["Brand"] = all_df["Brand"].astype(str).str.strip().str.upper()
-    selected_brands = [b.upper() for b in selected_brands]
+    selected_brands = [b.strip().upper() for b in selected_brands]
 
     df_filtered = filter_produk(
         all_df,
@@ -652,12 +580,13 @@ def page_produk(page=1):
         categories=selected_categories,
         alcohol_free=alcohol_free,
         fragrance_free=fragrance_free,
-        non_comedogenic=non_comedogenic
+        non_comedogenic=non_comedogenic,
+        index=catalog.search_index(),
+        bitmaps=catalog.bitmap_index(),
+        fuzzy=catalog.trigram_index()
     )
 
-    # Pastikan tidak ada duplikat
-    df_filtered = df_filtered.drop_duplicates(subset=["Nama Produk"]).reset_index(drop=True)
-
+    # Tidak perlu drop_duplicates: listing_frame sudah 1 baris per produk
     items = []
     per_page = 12
     total = len(df_filtered)
@@ -673,25 +602,8 @@ def page_produk(page=1):
         end = start + per_page
         df_page = df_filtered.iloc[start:end]
 
-        for _, r in df_page.iterrows():
-            items.append({
-            "nama": r.get("Nama Produk", ""),
-            "brand": r.get("Brand", ""),
-            "kategori": r.get("Kategori", ""),
-            "kandungan": r.get("Kandungan Utama", ""),
-            "image_url": get_image_path(
-            r.get("Kategori", ""),
-            r.get("Nama Produk", ""),
-            r.get("Gambar") or r.get("image", "")
-        ),
-            "manfaat": generate_product_benefits(
-                r.get("Kandungan Utama", ""),
-                r.get("Kategori", "")
-            ),
-            "alcohol_free": bool(r.get("Alcohol-Free")),
-            "fragrance_free": bool(r.get("Fragrance-Free")),
-            "non_comedogenic": bool(r.get("Non-Comedogenic")),
-        })
+        cards = product_cards(catalog)
+        items = [page_item(cards[product_id]) for product_id in df_page.index]
     else:
         total_pages = 1
 
@@ -708,19 +620,53 @@ def page_produk(page=1):
         non_comedogenic=non_comedogenic,
         page=page,
         total_pages=total_pages,
+        facets=product_facets(
+            catalog,
+            search=search,
+            brands=selected_brands,
+            categories=selected_categories,
+            alcohol_free=alcohol_free,
+            fragrance_free=fragrance_free,
+            non_comedogenic=non_comedogenic
+        ),
         request=request
 )
 
-def filter_produk(df, search=None, brands=None, categories=None, non_comedogenic=False, fragrance_free=False, alcohol_free=False):
-    
-    df = df.copy()
+def match_search(df, search):
+    return df[
+        df["Brand"].str.contains(search, case=False, na=False) |
+        df["Nama Produk"].str.contains(search, case=False, na=False) |
+        df.get("Kandungan Utama", "").astype(str).str.contains(search, case=False, na=False)
+    ]
+
+def filter_produk(df, search=None, brands=None, categories=None, non_comedogenic=False, fragrance_free=False, alcohol_free=False,
+                  index=None, bitmaps=None, fuzzy=None):
+    # df bisa berupa view catalog yang dipakai bersama → tiap filter menghasilkan
+    # frame baru, jadi tidak perlu copy seluruh catalog di awal
+    base = df
+    facet_args = dict(brands=brands, categories=categories, non_comedogenic=non_comedogenic,
+                      fragrance_free=fragrance_free, alcohol_free=alcohol_free)
+
+    if bitmaps is not None:
+        # semua facet (brand, kategori, flag) + kandidat search jadi satu AND bitmap
+        flags = [col for col, on in (("Alcohol-Free", alcohol_free),
+                                     ("Fragrance-Free", fragrance_free),
+                                     ("Non-Comedogenic", non_comedogenic)) if on]
+        ids = index.lookup(search, ["Brand", "Nama Produk", "Kandungan Utama"]) if search and index is not None else None
+        bits = bitmaps.query(
+            brands=brands,
+            categories=[c.lower().replace(" ", "") for c in categories or []],
+            flags=flags,
+            ids=ids
+        )
+        df = bitmaps.select(df, bits)
+        brands = categories = None
+        alcohol_free = fragrance_free = non_comedogenic = False
+    elif search and index is not None:
+        df = index.candidates(df, search, ["Brand", "Nama Produk", "Kandungan Utama"])
 
     if search:
-        df = df[
-            df["Brand"].str.contains(search, case=False, na=False) |
-            df["Nama Produk"].str.contains(search, case=False, na=False) |
-            df.get("Kandungan Utama", "").astype(str).str.contains(search, case=False, na=False)
-        ]
+        df = match_search(df, search)
 
     if brands:
         df = df[df["Brand"].isin(brands)]
@@ -738,8 +684,54 @@ def filter_produk(df, search=None, brands=None, categories=None, non_comedogenic
     if non_comedogenic and "Non-Comedogenic" in df.columns:
         df = df[df["Non-Comedogenic"] == True]
 
+    # Search tidak menemukan apa pun → fallback fuzzy (typo), urut similarity
+    if search and fuzzy is not None and df.empty and not has_exact_match(
+            base, search, ["Brand", "Nama Produk", "Kandungan Utama"], match_search, index):
+        ranked = fuzzy.rank(base, search, ["Brand", "Nama Produk", "Kandungan Utama"], limit=FUZZY_MAX_RESULTS)
+        return filter_produk(ranked, **facet_args)
     return df
 
+# -------------------------
+# FACET COUNT (SIDEBAR FILTER)
+# -------------------------
+FLAG_PARAMS = {
+    "Alcohol-Free": "alcohol_free",
+    "Fragrance-Free": "fragrance_free",
+    "Non-Comedogenic": "non_comedogenic",
+}
+FACET_CACHE_SIZE = 512
+
+def product_facets(catalog, search=None, brands=None, categories=None, alcohol_free=False, fragrance_free=False,
+                   non_comedogenic=False):
+    """
+    Jumlah produk per brand / kategori / flag untuk query saat ini.
+    Dihitung dari bitmap index, di-cache per versi catalog (cache ikut basi saat reload).
+    Cache-nya LRU yang sama dengan response cache (thread-safe, tanpa TTL).
+    """
+    brands = sorted(b.strip().upper() for b in brands or [])
+    categories = sorted(c.lower().replace(" ", "") for c in categories or [])
+    flags = [col for col, on in (("Alcohol-Free", alcohol_free),
+                                 ("Fragrance-Free", fragrance_free),
+                                 ("Non-Comedogenic", non_comedogenic)) if on]
+    key = (search or "", tuple(brands), tuple(categories), tuple(flags))
+
+    cache = catalog.derived("facet_cache", lambda c: ResponseCache(maxsize=FACET_CACHE_SIZE, ttl=0))
+    counts = cache.get(key)
+    if counts is not None:
+        return counts
+
+    # id produk yang lolos search (cek substring sama persis seperti filter_produk)
+    ids = None
+    if search:
+        ids = filter_produk(catalog.listing_frame(), search=search, index=catalog.search_index(),
+                            bitmaps=catalog.bitmap_index(), fuzzy=catalog.trigram_index()).index.to_numpy()
+
+    counts = catalog.bitmap_index().facet_counts(brands=brands, categories=categories, flags=flags, ids=ids)
+    counts["flags"] = {FLAG_PARAMS.get(col, col): n for col, n in counts["flags"].items()}
+
+    cache.set(key, counts)
+    return counts
+
 @app.route("/chatbot")
 def page_chatbot():
     return render_template("chatbot.html")
@@ -988,6 +980,9 @@ PRODUCT_BENEFIT_RULES = {
     "niacinamide b3": ["membantu mencerahkan kulit", "menyamarkan bekas jerawat", "menenangkan kulit"]
 }
 
+# Semua key aturan dikompilasi sekali (Aho–Corasick) → cocokkan kandungan dalam satu scan
+BENEFIT_MATCHER = KeywordMatcher(PRODUCT_BENEFIT_RULES)
+
 
 CATEGORY_BASE_BENEFITS = {
     "facialwash": [
@@ -1012,11 +1007,21 @@ CATEGORY_BASE_BENEFITS = {
     ]
 }
 
-@app.route("/api/produk", methods=["GET"])
-def api_produk():
-    q = request.args.get("q", "").strip()
-    category = request.args.get("category", "").strip().lower()
-    brand = request.args.get("brand", "").strip()
+API_PAGE_SIZE = 60
+API_MAX_PAGE_SIZE = 200
+
+API_MAX_BATCH = 20
+
+def query_produk(catalog, args, shared=None):
+    """
+    Satu query /api/produk terhadap snapshot catalog tertentu → (payload, status).
+    args cukup punya .get() (request.args atau dict dari body batch).
+    shared: memo antar query dalam satu batch (hasil lookup search & bitmap kategori).
+    """
+    shared = {} if shared is None else shared
+    q = str(args.get("q", "") or "").strip()
+    category = str(args.get("category", "") or "").strip().lower()
+    brand = str(args.get("brand", "") or "").strip()
 
     # Normalisasi kategori (sudah benar)
     catmap = {
@@ -1036,49 +1041,153 @@ def api_produk():
         return str(val).strip().upper() in ["YES", "TRUE", "1", "ON"]
 
     prefs = {
-        "Alcohol-Free": is_true(request.args.get("alcohol_free", "")),
-        "Fragrance-Free": is_true(request.args.get("fragrance_free", "")),
-        "Non-Comedogenic": is_true(request.args.get("non_comedogenic", "")),
+        "Alcohol-Free": is_true(args.get("alcohol_free", "")),
+        "Fragrance-Free": is_true(args.get("fragrance_free", "")),
+        "Non-Comedogenic": is_true(args.get("non_comedogenic", "")),
     }
 
-    # Ambil dataframe berdasarkan kategori
-    if category and category in DATASET:
-        df = DATASET[category].copy()
-    else:
-        # Jika kategori tidak spesifik, gabungkan semua dataset yang ada
-        df = pd.concat(list(DATASET.values())) if DATASET else pd.DataFrame()
+    # Ukuran halaman (default 60 seperti sebelumnya) + cursor halaman berikutnya
+    try:
+        limit = int(args.get("limit", API_PAGE_SIZE))
+    except (TypeError, ValueError):
+        limit = API_PAGE_SIZE
+    limit = max(1, min(limit, API_MAX_PAGE_SIZE))
 
-    if df.empty:
-        return jsonify({"items": [], "count": 0})
+    if not catalog or catalog.products.empty:
+        return {"items": [], "count": 0, "next": None}, 200
 
-    # Terapkan filter (fungsi apply_filters yang kamu buat sebelumnya)
-    df = apply_filters(df, q=q, brand=brand, prefs=prefs)
-    
-    # Ambil top 60 saja biar gak berat pas loading di browser
-    df = df.head(60)
+    try:
+        after = decode_cursor(str(args.get("cursor", "") or "").strip(), catalog)
+    except InvalidCursor as e:
+        return {"status": "error", "message": str(e)}, 400
 
-    items = []
-    for _, r in df.iterrows():
-        # Ambil path gambar (pake fungsi get_image_path yang kita bahas tadi)
-        img_col = r.get("Gambar") or r.get("image") or ""
-        
-        items.append({
-            "nama": r.get("Nama Produk", ""),
-            "brand": r.get("Brand", ""),
-            "kategori": r.get("Kategori", ""),
-            "kandungan": r.get("Kandungan Utama", ""),
-            # Konversi value ke boolean murni untuk frontend
-            "alcohol_free": is_true(r.get("Alcohol-Free")),
-            "fragrance_free": is_true(r.get("Fragrance-Free")),
-            "non_comedogenic": is_true(r.get("Non-Comedogenic")),
-            "image_url": get_image_path(
-                r.get("Kategori", ""),
-                r.get("Nama Produk", ""),
-                img_col
-            )
-        })
-    
-    return jsonify({"items": items, "count": len(items)})
+    # Semua filter di-resolve di bitmap → cuma dapat daftar product_id (belum ada baris)
+    bitmaps = catalog.bitmap_index()
+    ids = None
+    if q:
+        key = ("search", q)
+        if key not in shared:
+            shared[key] = catalog.search_index().lookup(q, ["Nama Produk", "Kandungan Utama"])
+        ids = shared[key]
+    bits = bitmaps.query(
+        brands=[brand.lower()] if brand else None,
+        flags=[key for key, val in prefs.items() if val],
+        brand_facet="brand_lower",
+        ids=ids
+    )
+    # Kategori tidak dikenal → semua kategori (sama seperti sebelumnya)
+    if category and category in catalog:
+        key = ("kategori", category)
+        if key not in shared:
+            shared[key] = bitmaps.any_of("kategori", [category_filter_key(category)])
+        bits &= shared[key]
+
+    # Baris baru dimaterialisasi untuk halaman ini saja (cek substring q per chunk)
+    df, last_id = keyset_page(
+        catalog.products,
+        bitmaps.ids_of(bits),
+        after,
+        limit,
+        keep=(lambda rows: match_query(rows, q)) if q else None
+    )
+
+    # Query tanpa hasil persis (sebelum facet) → fallback fuzzy (typo). Kandidat
+    # fuzzy dibatasi, jadi cukup satu halaman berurut similarity tanpa cursor lanjutan.
+    if q and after is None and df.empty and not has_exact_match(
+            catalog.products, q, ["Nama Produk", "Kandungan Utama"], match_query, catalog.search_index()):
+        frame = catalog.product_frame(category) if category and category in catalog else catalog.products
+        df = apply_filters(frame, q=q, brand=brand, prefs=prefs, fuzzy=catalog.trigram_index()).head(limit)
+        last_id = None
+
+    cards = product_cards(catalog)
+    items = [api_item(cards[product_id]) for product_id in df.index]
+
+    return {
+        "items": items,
+        "count": len(items),
+        "next": encode_cursor(catalog, last_id) if last_id is not None else None
+    }, 200
+
+@app.route("/api/produk", methods=["GET"])
+@conditional_get(catalog_version)
+@cached_response(RESPONSE_CACHE, catalog_version)
+def api_produk():
+    payload, status = query_produk(get_catalog(), request.args)
+    return jsonify(payload), status
+
+# -------------------------
+# API: Export Catalog (NDJSON / CSV, streaming)
+# -------------------------
+EXPORT_FIELDS = [
+    "product_id", "nama", "brand", "kategori", "kandungan", "manfaat",
+    "alcohol_free", "fragrance_free", "non_comedogenic", "note", "image_url"
+]
+
+def export_item(product_id, card):
+    return {
+        "product_id": product_id,
+        **api_item(card),
+        "manfaat": card["manfaat"],
+        "note": card["note"]
+    }
+
+@app.route("/api/produk/export", methods=["GET"])
+@conditional_get(catalog_version)
+def api_produk_export():
+    fmt = request.args.get("format", "ndjson").strip().lower()
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"status": "error", "message": "format harus ndjson atau csv."}), 400
+
+    # Snapshot diambil sekali → seluruh dump konsisten walau catalog di-reload saat streaming
+    catalog = get_catalog()
+    cards = product_cards(catalog)
+    product_ids = catalog.products.index.tolist()
+
+    def records():
+        for chunk in iter_chunks(product_ids):
+            yield [export_item(product_id, cards[product_id]) for product_id in chunk]
+
+    if fmt == "csv":
+        body = csv_stream(records(), EXPORT_FIELDS)
+    else:
+        body = ndjson_stream(records(), app.json.dumps)
+
+    response = Response(stream_with_context(body), mimetype=EXPORT_FORMATS[fmt])
+    response.headers["Content-Disposition"] = f'attachment; filename="skinalyze-produk-{catalog.version[:12]}.{fmt}"'
+    return response
+
+# -------------------------
+# API: Batch Produk (banyak widget dalam 1 request)
+# -------------------------
+@app.route("/api/produk/batch", methods=["POST"])
+def api_produk_batch():
+    data = request.get_json(silent=True)
+    queries = data.get("queries") if isinstance(data, dict) else data
+    if not isinstance(queries, list) or not all(isinstance(q, dict) for q in queries):
+        return jsonify({"status": "error", "message": "Body harus berisi 'queries': list objek query."}), 400
+    if len(queries) > API_MAX_BATCH:
+        return jsonify({"status": "error", "message": f"Maksimal {API_MAX_BATCH} query per batch."}), 400
+
+    # Semua query dijawab dari snapshot yang sama, walau catalog di-reload di tengah jalan
+    catalog = get_catalog()
+    shared = {}
+    done = {}
+    results = []
+    for query in queries:
+        # query identik dalam satu batch cukup dihitung sekali
+        key = tuple(sorted((k, str(v)) for k, v in query.items()))
+        if key not in done:
+            # query gagal (cursor rusak dll) → objek error di posisinya, batch tetap jalan
+            done[key], _ = query_produk(catalog, query, shared)
+        results.append(done[key])
+
+    response = jsonify({
+        "results": results,
+        "count": len(results),
+        "version": catalog.version if catalog else None
+    })
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 def generate_product_benefits(kandungan_text, kategori):
     manfaat = []
@@ -1096,11 +1205,11 @@ def generate_product_benefits(kandungan_text, kategori):
     # 2️⃣ Manfaat dari kandungan utama
     if kandungan_text and isinstance(kandungan_text, str):
         kandungan_text = kandungan_text.lower()
-        for ingredient, benefits in PRODUCT_BENEFIT_RULES.items():
-            if ingredient in kandungan_text:
-                for b in benefits:
-                    if b not in manfaat:
-                        manfaat.append(b)
+        # urutan hasil = urutan aturan di PRODUCT_BENEFIT_RULES (sama seperti loop lama)
+        for ingredient in BENEFIT_MATCHER.find(kandungan_text):
+            for b in PRODUCT_BENEFIT_RULES[ingredient]:
+                if b not in manfaat:
+                    manfaat.append(b)
 
     if not manfaat:
         return "Membantu merawat dan menjaga kesehatan kulit."
@@ -1119,6 +1228,117 @@ def generate_product_benefits(kandungan_text, kategori):
             + "."
         )
 
+# -------------------------
+# CARD PRODUK (DIHITUNG SEKALI PER VERSI CATALOG + VERSI GAMBAR)
+# -------------------------
+def build_product_cards(catalog, images):
+    """
+    product_id → card (nama, brand, kategori, kandungan, gambar, manfaat, flag, catatan).
+    Cek file gambar & scan aturan manfaat cukup sekali per produk per versi catalog.
+    Gambar disimpan sebagai filename static, url_for dipanggil saat dipakai.
+    """
+    products = catalog.products
+    # kolom diambil sekali per kolom (bukan iterrows per baris)
+    rows = frame_records(products, {
+        "nama": "Nama Produk",
+        "brand": "Brand",
+        "kategori": "Kategori",
+        "kandungan": "Kandungan Utama",
+        "gambar": "Gambar",
+        "image": "image",
+        "catatan": "Catatan",
+    })
+    alcohol_free = flag_values(products, "Alcohol-Free")
+    fragrance_free = flag_values(products, "Fragrance-Free")
+    non_comedogenic = flag_values(products, "Non-Comedogenic")
+
+    cards = {}
+    for i, (product_id, row) in enumerate(zip(products.index.tolist(), rows)):
+        image = images.resolve(row["kategori"], row["nama"], row["gambar"] or row["image"] or "")
+        notes = []
+        if not fragrance_free[i]:
+            notes.append("Produk ini mengandung fragrance, sebaiknya dihindari jika kulit sangat sensitif.")
+        if not alcohol_free[i]:
+            notes.append("Produk ini mengandung alkohol, perhatikan bila kulit mudah kering atau iritasi.")
+        if not non_comedogenic[i]:
+            notes.append("Produk ini berpotensi comedogenic, kurang cocok jika mudah berjerawat.")
+        # Tambahkan catatan manual dari dataset jika ada
+        if row["catatan"] and str(row["catatan"]).lower() != "nan":
+            notes.append(str(row["catatan"]).strip())
+
+        cards[product_id] = {
+            "nama": row["nama"],
+            "brand": row["brand"],
+            "brand_label": str(row["brand"]).strip().upper(),
+            "kategori": row["kategori"],
+            "kandungan": row["kandungan"],
+            "image": image,
+            "thumbs": images.srcset(image),
+            "manfaat": generate_product_benefits(row["kandungan"], row["kategori"]),
+            "alcohol_free": alcohol_free[i],
+            "fragrance_free": fragrance_free[i],
+            "non_comedogenic": non_comedogenic[i],
+            "note": notes
+        }
+    return cards
+
+def product_cards(catalog):
+    # gambar sudah di-resolve di card → card dibangun ulang kalau manifest gambar berubah.
+    # Satu slot (versi gambar, cards) per snapshot: versi lama langsung diganti, tidak menumpuk.
+    images = IMAGE_STORE.current()
+    slot = catalog.derived("product_cards", lambda c: {"lock": threading.Lock(), "entry": (None, None)})
+    version, cards = slot["entry"]
+    if version == images.version:
+        return cards
+    with slot["lock"]:
+        version, cards = slot["entry"]
+        if version != images.version:
+            cards = build_product_cards(catalog, images)
+            slot["entry"] = (images.version, cards)
+        return cards
+
+def page_item(card):
+    """Card untuk template home/produk (brand ditampilkan uppercase)."""
+    return {
+        "nama": card["nama"],
+        "brand": card["brand_label"],
+        "kategori": card["kategori"],
+        "kandungan": card["kandungan"],
+        "image_url": url_for('static', filename=card["image"]),
+        "image_srcset": image_srcset(card),
+        "manfaat": card["manfaat"],
+        "alcohol_free": card["alcohol_free"],
+        "fragrance_free": card["fragrance_free"],
+        "non_comedogenic": card["non_comedogenic"],
+    }
+
+def api_item(card):
+    return {
+        "nama": card["nama"],
+        "brand": card["brand"],
+        "kategori": card["kategori"],
+        "kandungan": card["kandungan"],
+        "alcohol_free": card["alcohol_free"],
+        "fragrance_free": card["fragrance_free"],
+        "non_comedogenic": card["non_comedogenic"],
+        "image_url": url_for('static', filename=card["image"]),
+        "image_srcset": image_srcset(card)
+    }
+
+def recommend_item(card):
+    return {
+        "nama": card["nama"],
+        "brand": card["brand"],
+        "kategori": card["kategori"],
+        "kandungan": card["kandungan"],
+        "image_url": url_for('static', filename=card["image"]),
+        "image_srcset": image_srcset(card),
+        "alcohol_free": card["alcohol_free"],
+        "fragrance_free": card["fragrance_free"],
+        "non_comedogenic": card["non_comedogenic"],
+        "note": list(card["note"])
+    }
+
 # -------------------------
 # API: Rekomendasi
 # -------------------------
@@ -1139,18 +1359,103 @@ def api_rekomendasi():
 
     results = recommend(category, jenis_kulit, masalah_kulit, prefs, top_k=10)
 
-    return jsonify({"items": results})
+    # Hasil diacak (df.sample) & lewat POST → tidak deterministik, jangan di-cache
+    response = jsonify({"items": results})
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+# -------------------------
+# API: Facet Count
+# -------------------------
+@app.route("/api/produk/facets", methods=["GET"])
+@conditional_get(catalog_version)
+def api_produk_facets():
+    facets = product_facets(
+        get_catalog(),
+        search=request.args.get("search", "").strip(),
+        brands=request.args.getlist("brand"),
+        categories=request.args.getlist("kategori"),
+        alcohol_free=get_bool_param("alcohol_free"),
+        fragrance_free=get_bool_param("fragrance_free"),
+        non_comedogenic=get_bool_param("non_comedogenic")
+    )
+    return jsonify(facets)
+
+# -------------------------
+# API: Autocomplete kotak pencarian
+# -------------------------
+def suggest_index(catalog):
+    return catalog.derived(
+        "suggest_index",
+        lambda c: build_suggest_index(c.products, c.search_index(), INGREDIENT_SYNONYMS)
+    )
+
+@app.route("/api/suggest", methods=["GET"])
+@conditional_get(catalog_version, cache_control=SHORT_LIVED)
+def api_suggest():
+    prefix = request.args.get("prefix", "").strip()
+    try:
+        k = int(request.args.get("k", DEFAULT_SUGGESTIONS))
+    except ValueError:
+        k = DEFAULT_SUGGESTIONS
+    return jsonify({"prefix": prefix, "suggestions": suggest_index(get_catalog()).lookup(prefix, k)})
 
 # -------------------------
 # API: Brands
 # -------------------------
 @app.route("/api/brands", methods=["GET"])
+@conditional_get(catalog_version, cache_control=SHORT_LIVED)
+@cached_response(RESPONSE_CACHE, catalog_version)
 def api_brands():
-    all_df = pd.concat(list(DATASET.values())) if DATASET else pd.DataFrame()
-    brands = sorted(all_df["Brand"].dropna().unique().tolist()) if "Brand" in all_df.columns else []
+    brands = get_catalog().brand_list()
     return jsonify({"brands": brands})
 
 
+# -------------------------
+# API: Reload Catalog (Admin)
+# -------------------------
+def is_admin_request():
+    token = os.getenv("SKINALYZE_ADMIN_TOKEN", "")
+    return bool(token) and request.headers.get("X-Admin-Token", "") == token
+
+@app.route("/api/admin/catalog/reload", methods=["POST"])
+def api_reload_catalog():
+    if not is_admin_request():
+        return jsonify({"status": "error", "message": "Tidak diizinkan."}), 403
+
+    force = str(request.args.get("force", "")).strip().lower() in ["1", "true", "yes", "on"]
+    catalog, changed = load_all_datasets(force=force)
+    return jsonify({
+        "status": "success",
+        "changed": changed,
+        "version": catalog.version,
+        "products": len(catalog.products),
+        "rows": catalog.row_count
+    })
+
+# -------------------------
+# API: Buat Ulang Thumbnail (Admin)
+# -------------------------
+@app.route("/api/admin/thumbnails", methods=["POST"])
+def api_build_thumbnails():
+    if not is_admin_request():
+        return jsonify({"status": "error", "message": "Tidak diizinkan."}), 403
+
+    stats = build_thumbnails()
+    if stats.get("error"):
+        # tanpa Pillow: bukan error server, gambar asli tetap disajikan
+        return jsonify({"status": "error", "message": stats["error"]}), 503
+    return jsonify({"status": "success", **stats})
+
+# -------------------------
+# API: Statistik Response Cache (Admin)
+# -------------------------
+@app.route("/api/admin/cache/stats", methods=["GET"])
+def api_cache_stats():
+    if not is_admin_request():
+        return jsonify({"status": "error", "message": "Tidak diizinkan."}), 403
+    return jsonify({"status": "success", "version": catalog_version(), **RESPONSE_CACHE.stats()})
+
 # ============================================================ 
 # API CHATBOT 
 # ============================================================
@@ -1176,7 +1481,7 @@ def init_state():
         "last_index": 0,
         "last_user_input": "",
 
-        "dataset": CHATBOT_DATASET
+        "dataset": load_chatbot_dataset(get_catalog())
     }
 
 # =========================
@@ -1208,6 +1513,8 @@ def chatbot_api():
         })
     
     state["last_user_input"] = user_message_raw.lower()
+    # selalu pakai snapshot catalog terbaru (record view di-cache per versi)
+    state["dataset"] = load_chatbot_dataset(get_catalog())
 
     reply = chatbot_logic(user_message_raw, state)
 
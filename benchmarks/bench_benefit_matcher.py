@@ -0,0 +1,65 @@
+# =====================================================
+# BENCHMARK: ATURAN MANFAAT (LOOP SUBSTRING vs AHO–CORASICK)
+# =====================================================
+# Jalankan dari root repo:
+#   python benchmarks/bench_benefit_matcher.py --rows 10000
+# Teks kandungan catalog asli diperbanyak sampai >= --rows. Selain itu juga
+# diukur teks kandungan panjang (daftar INCI lengkap) karena biaya loop lama
+# ∝ jumlah aturan, sedangkan automaton ∝ panjang teks.
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from catalog import load_catalog, KeywordMatcher
+from mapping.product.product_benefit_mapping import PRODUCT_BENEFIT_RULES
+
+
+def build_texts(rows: int) -> list:
+    products = load_catalog(ROOT / "dataset").products
+    texts = [str(t).lower() for t in products["Kandungan Utama"].tolist()]
+    return (texts * max(1, -(-rows // len(texts))))[:max(rows, len(texts))]
+
+
+# ---------- Versi lama ----------
+def match_loop(text: str) -> list:
+    return [ingredient for ingredient in PRODUCT_BENEFIT_RULES if ingredient in text]
+
+
+def best_of(fn, texts, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [fn(t) for t in texts]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(PRODUCT_BENEFIT_RULES)
+    build = time.perf_counter() - start
+    print(f"[BENCH] {len(matcher.keywords)} aturan, automaton {len(matcher._delta)} state, build {build * 1000:.1f} ms")
+
+    texts = build_texts(args.rows)
+    long_texts = [", ".join(texts[i:i + 8]) for i in range(0, len(texts), 8)]
+    for label, sample in [("kandungan utama", texts), ("kandungan panjang (8x)", long_texts)]:
+        avg = sum(map(len, sample)) / len(sample)
+        old_t, old_hits = best_of(match_loop, sample, args.repeat)
+        new_t, new_hits = best_of(matcher.find, sample, args.repeat)
+        assert old_hits == new_hits, "hasil match berbeda!"
+        print(f"[BENCH] {label:22s} {len(sample):6d} teks (~{avg:.0f} char) | "
+              f"loop: {old_t * 1000:8.1f} ms | aho-corasick: {new_t * 1000:8.1f} ms | {old_t / new_t:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
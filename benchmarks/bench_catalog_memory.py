@@ -0,0 +1,45 @@
+# =====================================================
+# BENCHMARK: MEMORI CATALOG (LAYOUT SKEMA vs DTYPE COMPACT)
+# =====================================================
+# Jalankan dari root repo:
+#   python benchmarks/bench_catalog_memory.py
+# Dua penghematan diukur terpisah supaya tidak tercampur:
+#   1. layout: frame per baris (1 baris per produk × jenis kulit) → skema
+#      products / skin_types / product_skin / overrides, dtype sama
+#   2. dtype : skema yang sama, sebelum vs sesudah compact_dataframe()
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from catalog import load_frames, build_product_schema, compact_dataframe, memory_report
+
+
+def print_tables(label: str, sizes: dict):
+    for key, size in sizes.items():
+        print(f"[BENCH] {label:8s} {key:12s} {size / 1024:9.1f} KB")
+
+
+def print_step(label: str, report: dict):
+    before, after = report["before_bytes"], report["after_bytes"]
+    print(f"[BENCH] {label:8s} {before / 1024:9.1f} KB → {after / 1024:9.1f} KB ({after / before * 100:.0f}%)")
+
+
+def main():
+    frames = load_frames(ROOT / "dataset")
+    schema = build_product_schema(frames)
+    compacted = schema.compact(compact_dataframe)
+
+    layout = memory_report(frames, schema.tables())
+    dtype = memory_report(schema.tables(), compacted.tables())
+    print_tables("baris", layout["before"])
+    print_tables("skema", layout["after"])
+    print_tables("compact", dtype["after"])
+    print_step("layout", layout)
+    print_step("dtype", dtype)
+    print_step("total", memory_report(frames, compacted.tables()))
+
+
+if __name__ == "__main__":
+    main()
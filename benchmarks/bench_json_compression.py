@@ -0,0 +1,94 @@
+# =====================================================
+# BENCHMARK: JSON PROVIDER (STDLIB vs ORJSON) + KOMPRESI
+# =====================================================
+# Jalankan dari root repo:
+#   python benchmarks/bench_json_compression.py --repeat 50
+# Mengukur ukuran payload (identity / gzip / br) dan latency encode +
+# end-to-end lewat test client untuk /api/produk, /api/rekomendasi, /api/chatbot.
+# orjson & brotli opsional: kalau tidak terpasang, kolomnya dilewati.
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+# response cache dimatikan supaya tiap request benar-benar diproses
+os.environ["SKINALYZE_RESPONSE_CACHE_SIZE"] = "0"
+
+from flask.json.provider import DefaultJSONProvider
+
+import app as skinalyze
+from web.compression import brotli, compress_body
+from web.jsonprovider import OrjsonProvider, orjson
+
+CASES = [
+    ("GET /api/produk?limit=200", "get", "/api/produk?limit=200", None),
+    ("POST /api/rekomendasi", "post", "/api/rekomendasi",
+     {"category": "serum", "jenis_kulit": "berminyak", "masalah_kulit": ["jerawat"], "preferences": {}}),
+    ("POST /api/chatbot", "post", "/api/chatbot",
+     {"message": "rekomendasi serum untuk kulit berminyak dan berjerawat"}),
+]
+
+
+def median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def request(client, method, url, body, encoding):
+    headers = {"Accept-Encoding": encoding}
+    if method == "get":
+        return client.get(url, headers=headers)
+    return client.post(url, json=body, headers=headers)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    flask_app = skinalyze.app
+    client = flask_app.test_client()
+    providers = {"stdlib": DefaultJSONProvider(flask_app)}
+    if orjson is not None:
+        providers["orjson"] = OrjsonProvider(flask_app)
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    print(f"[BENCH] provider: {', '.join(providers)} | encoding: {', '.join(encodings)} | median of {args.repeat}")
+
+    for name, method, url, body in CASES:
+        flask_app.json = providers["stdlib"]
+        obj = request(client, method, url, body, "identity").get_json()
+        raw = providers["stdlib"].dumps(obj).encode("utf-8")
+
+        print(f"\n[BENCH] {name}")
+        sizes = [f"identity {len(raw):7d} B"]
+        for enc in encodings[1:]:
+            packed = compress_body(raw, enc)
+            t = median_ms(lambda: compress_body(raw, enc), args.repeat)
+            sizes.append(f"{enc} {len(packed):6d} B ({len(packed) / len(raw):5.1%}, {t:5.2f} ms)")
+        print("  ukuran  : " + " | ".join(sizes))
+
+        for pname, provider in providers.items():
+            t = median_ms(lambda: provider.dumps(obj), args.repeat)
+            print(f"  encode  : {pname:7s} {t:6.2f} ms")
+
+        for pname, provider in providers.items():
+            flask_app.json = provider
+            row = []
+            for enc in encodings:
+                t = median_ms(lambda: request(client, method, url, body, enc), args.repeat)
+                row.append(f"{enc} {t:6.2f} ms")
+            print(f"  request : {pname:7s} " + " | ".join(row))
+
+    flask_app.json = providers["stdlib"]
+
+
+if __name__ == "__main__":
+    main()
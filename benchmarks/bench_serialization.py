@@ -0,0 +1,105 @@
+# =====================================================
+# BENCHMARK: SERIALISASI BARIS (ITERROWS vs PER KOLOM)
+# =====================================================
+# Jalankan dari root repo:
+#   python benchmarks/bench_serialization.py --rows 10000
+# Catalog asli diperbanyak sampai >= --rows baris supaya bedanya kelihatan.
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from catalog import load_catalog, frame_records, flag_values, safety_scores
+
+FLAGS = ["Alcohol-Free", "Fragrance-Free", "Non-Comedogenic"]
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    products = load_catalog(ROOT / "dataset").products
+    times = max(1, -(-rows // len(products)))
+    df = pd.concat([products] * times, ignore_index=True)
+    df["Nama Produk"] = df["Nama Produk"].astype(str) + " #" + (df.index // len(products)).astype(str)
+    return df
+
+
+# ---------- Versi lama (iterrows / apply) ----------
+def items_iterrows(df: pd.DataFrame) -> list:
+    items = []
+    for _, r in df.iterrows():
+        items.append({
+            "nama": r.get("Nama Produk", ""),
+            "brand": r.get("Brand", ""),
+            "kategori": r.get("Kategori", ""),
+            "kandungan": r.get("Kandungan Utama", ""),
+            "alcohol_free": bool(r.get("Alcohol-Free")),
+            "fragrance_free": bool(r.get("Fragrance-Free")),
+            "non_comedogenic": bool(r.get("Non-Comedogenic")),
+        })
+    return items
+
+
+def scores_apply(df: pd.DataFrame) -> pd.Series:
+    def calculate_safety_score(row):
+        score = 0
+        for col in FLAGS:
+            if row.get(col) is True: score += 1
+        return score
+    return df.apply(calculate_safety_score, axis=1)
+
+
+# ---------- Versi baru (per kolom) ----------
+def items_columnar(df: pd.DataFrame) -> list:
+    items = frame_records(df, {
+        "nama": "Nama Produk",
+        "brand": "Brand",
+        "kategori": "Kategori",
+        "kandungan": "Kandungan Utama",
+    })
+    flags = {
+        "alcohol_free": flag_values(df, "Alcohol-Free"),
+        "fragrance_free": flag_values(df, "Fragrance-Free"),
+        "non_comedogenic": flag_values(df, "Non-Comedogenic"),
+    }
+    for i, item in enumerate(items):
+        for key, values in flags.items():
+            item[key] = values[i]
+    return items
+
+
+def best_of(fn, df, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(df)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+    print(f"[BENCH] {len(df)} baris, best of {args.repeat}")
+
+    old_t, old_items = best_of(items_iterrows, df, args.repeat)
+    new_t, new_items = best_of(items_columnar, df, args.repeat)
+    assert old_items == new_items, "hasil serialisasi berbeda!"
+    print(f"[BENCH] item dict  iterrows: {old_t * 1000:8.1f} ms | per kolom: {new_t * 1000:8.1f} ms | {old_t / new_t:5.1f}x")
+
+    old_t, old_scores = best_of(scores_apply, df, args.repeat)
+    new_t, new_scores = best_of(lambda d: safety_scores(d, FLAGS), df, args.repeat)
+    assert old_scores.tolist() == new_scores.tolist(), "safety score berbeda!"
+    print(f"[BENCH] safety score apply:    {old_t * 1000:8.1f} ms | per kolom: {new_t * 1000:8.1f} ms | {old_t / new_t:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# =====================================================
+# CATALOG PACKAGE INIT
+# =====================================================
+
+# ========================
+# Cache Binary Dataset
+# ========================
+from catalog.cache import (
+    load_or_build,
+    is_fresh,
+    clear_cache,
+    file_fingerprint,
+    file_hash,
+    CACHE_DIR
+)
+
+# ========================
+# Normalisasi Teks
+# ========================
+from catalog.text import (
+    clean_text,
+    tokenize,
+    normalize_dataset_text,
+    add_text_columns,
+    NORM_COLUMNS,
+    CHAT_TEXT_COLUMNS
+)
+
+# ========================
+# Loader & Catalog
+# ========================
+from catalog.loader import (
+    normalize_key,
+    normalize_filename,
+    normalize_dataframe,
+    read_dataset_file,
+    load_frames,
+    dataset_signature,
+    dataset_version,
+    frames_version,
+    compact_dataframe,
+    memory_report,
+    DatasetLoadError,
+    CATEGORY_ORDER
+)
+from catalog.schema import ProductSchema, build_product_schema
+from catalog.search import SearchIndex, build_search_index, SEARCH_FIELDS
+from catalog.bitmap import BitmapIndex, build_bitmap_index, FLAG_COLUMNS
+from catalog.fuzzy import TrigramIndex, build_trigram_index
+from catalog.suggest import SuggestIndex, build_suggest_index
+from catalog.matcher import KeywordMatcher
+from catalog.serialize import frame_records, column_values, flag_values, safety_scores
+from catalog.catalog import Catalog, CatalogStore, load_catalog
+
+# =====================================================
+# Exported symbols (PUBLIC API)
+# =====================================================
+__all__ = [
+    # cache
+    "load_or_build",
+    "is_fresh",
+    "clear_cache",
+    "file_fingerprint",
+    "file_hash",
+    "CACHE_DIR",
+
+    # text
+    "clean_text",
+    "tokenize",
+    "normalize_dataset_text",
+    "add_text_columns",
+    "NORM_COLUMNS",
+    "CHAT_TEXT_COLUMNS",
+
+    # loader
+    "normalize_key",
+    "normalize_filename",
+    "normalize_dataframe",
+    "read_dataset_file",
+    "load_frames",
+    "dataset_signature",
+    "dataset_version",
+    "frames_version",
+    "compact_dataframe",
+    "memory_report",
+    "DatasetLoadError",
+    "CATEGORY_ORDER",
+
+    # schema
+    "ProductSchema",
+    "build_product_schema",
+
+    # search
+    "SearchIndex",
+    "build_search_index",
+    "SEARCH_FIELDS",
+
+    # bitmap
+    "BitmapIndex",
+    "build_bitmap_index",
+    "FLAG_COLUMNS",
+
+    # fuzzy
+    "TrigramIndex",
+    "build_trigram_index",
+
+    # suggest
+    "SuggestIndex",
+    "build_suggest_index",
+
+    # matcher
+    "KeywordMatcher",
+
+    # serialize
+    "frame_records",
+    "column_values",
+    "flag_values",
+    "safety_scores",
+
+    # catalog
+    "Catalog",
+    "CatalogStore",
+    "load_catalog"
+]
@@ -0,0 +1,117 @@
+# =====================================================
+# BITMAP INDEX UNTUK FILTER BRAND / KATEGORI / FLAG
+# =====================================================
+# Satu bitmap (numpy packed bits) per nilai facet, urutan bit = urutan
+# tabel produk. Kombinasi filter cukup OR di dalam satu facet lalu AND
+# antar facet; baris DataFrame baru diambil setelah bitmap akhirnya jadi.
+import numpy as np
+import pandas as pd
+
+FLAG_COLUMNS = ["Alcohol-Free", "Fragrance-Free", "Non-Comedogenic"]
+
+# popcount per byte, dipakai untuk hitung jumlah bit tanpa unpack
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+
+def brand_key(val) -> str:
+    """Key brand versi halaman (/ dan /produk): strip + uppercase."""
+    return str(val).strip().upper()
+
+
+def brand_lower_key(val) -> str:
+    """Key brand versi /api/produk: lowercase apa adanya."""
+    return str(val).lower()
+
+
+def category_filter_key(val) -> str:
+    return str(val).lower().replace(" ", "")
+
+
+class BitmapIndex:
+    def __init__(self, df: pd.DataFrame):
+        self.ids = df.index.to_numpy()
+        self._id_index = pd.Index(self.ids)
+        self.size = len(df)
+        self.all = np.packbits(np.ones(self.size, dtype=bool))
+        self.none = np.packbits(np.zeros(self.size, dtype=bool))
+        self.facets = {
+            "brand": self._build(df, "Brand", brand_key),
+            "brand_lower": self._build(df, "Brand", brand_lower_key),
+            "kategori": self._build(df, "Kategori", category_filter_key),
+        }
+        self.flags = {
+            col: np.packbits((df[col] == True).to_numpy(dtype=bool))
+            for col in FLAG_COLUMNS if col in df.columns
+        }
+
+    def _build(self, df: pd.DataFrame, col: str, key_fn) -> dict:
+        if col not in df.columns:
+            return {}
+        codes, uniques = pd.factorize(df[col].map(key_fn, na_action="ignore"))
+        return {key: np.packbits(codes == i) for i, key in enumerate(uniques)}
+
+    # ---------- Operasi bitmap ----------
+    def any_of(self, facet: str, keys) -> np.ndarray:
+        """OR bitmap semua key dalam satu facet (key yang tidak dikenal → kosong)."""
+        bitmaps = self.facets.get(facet, {})
+        bits = self.none.copy()
+        for key in keys:
+            hit = bitmaps.get(key)
+            if hit is not None:
+                bits |= hit
+        return bits
+
+    def flag(self, col: str) -> np.ndarray:
+        # kolom flag tidak ada → filter diabaikan (sama seperti versi pandas)
+        return self.flags.get(col, self.all)
+
+    def from_ids(self, ids) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=bool)
+        pos = self._id_index.get_indexer(ids)
+        mask[pos[pos >= 0]] = True
+        return np.packbits(mask)
+
+    def query(self, brands=None, categories=None, flags=None, brand_facet: str = "brand", ids=None) -> np.ndarray:
+        bits = self.all.copy()
+        if brands:
+            bits &= self.any_of(brand_facet, brands)
+        if categories:
+            bits &= self.any_of("kategori", categories)
+        for col in flags or []:
+            bits &= self.flag(col)
+        if ids is not None:
+            bits &= self.from_ids(ids)
+        return bits
+
+    def facet_counts(self, brands=None, categories=None, flags=None, ids=None) -> dict:
+        """
+        Jumlah produk per opsi filter untuk query saat ini.
+        Count per brand mengabaikan pilihan brand itu sendiri (begitu juga kategori),
+        jadi angka di sidebar = hasil kalau opsi tsb ikut dicentang.
+        """
+        base = self.query(flags=flags, ids=ids)
+        brand_bits = self.any_of("brand", brands) if brands else self.all
+        cat_bits = self.any_of("kategori", categories) if categories else self.all
+        current = base & brand_bits & cat_bits
+        return {
+            "total": self.count(current),
+            "brand": {key: self.count(base & cat_bits & bits) for key, bits in self.facets["brand"].items()},
+            "kategori": {key: self.count(base & brand_bits & bits) for key, bits in self.facets["kategori"].items()},
+            "flags": {col: self.count(current & bits) for col, bits in self.flags.items()},
+        }
+
+    @staticmethod
+    def count(bits: np.ndarray) -> int:
+        return int(_POPCOUNT[bits].sum())
+
+    def ids_of(self, bits: np.ndarray) -> np.ndarray:
+        return self.ids[np.unpackbits(bits, count=self.size).astype(bool)]
+
+    def select(self, df: pd.DataFrame, bits: np.ndarray) -> pd.DataFrame:
+        """Ambil baris df (ber-index product_id) yang bit-nya nyala; urutan df tetap."""
+        pos = df.index.get_indexer(self.ids_of(bits))
+        return df.iloc[np.sort(pos[pos >= 0])]
+
+
+def build_bitmap_index(df: pd.DataFrame) -> BitmapIndex:
+    return BitmapIndex(df)
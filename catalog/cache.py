@@ -0,0 +1,135 @@
+# =====================================================
+# CACHE KATALOG (BINARY) — BIAR STARTUP GAK PARSE XLSX TERUS
+# =====================================================
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Naikkan angka ini kalau hasil normalisasi dataset berubah,
+# supaya semua cache lama otomatis dianggap basi.
+CACHE_VERSION = 3
+
+CACHE_DIR = Path(os.getenv("SKINALYZE_CACHE_DIR", BASE_DIR / ".cache" / "catalog"))
+CACHE_ENABLED = os.getenv("SKINALYZE_CATALOG_CACHE", "1").strip().lower() not in ["0", "false", "no", "off"]
+
+
+def file_fingerprint(fp: Path) -> dict:
+    st = Path(fp).stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def file_hash(fp: Path) -> str:
+    h = hashlib.sha256()
+    with open(fp, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_paths(fp: Path, namespace: str):
+    folder = CACHE_DIR / namespace
+    stem = hashlib.sha1(Path(fp).resolve().as_posix().encode("utf-8")).hexdigest()[:16]
+    return folder / f"{stem}.pkl", folder / f"{stem}.meta.json"
+
+
+def _read_meta(meta_path: Path):
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _load_pickle(path: Path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def is_fresh(fp, namespace: str = "dataset") -> bool:
+    """Cek murah (tanpa hash): cache ada dan size + mtime sumber masih sama."""
+    if not CACHE_ENABLED:
+        return False
+    data_path, meta_path = _cache_paths(Path(fp), namespace)
+    meta = _read_meta(meta_path)
+    if not meta or meta.get("version") != CACHE_VERSION or not data_path.exists():
+        return False
+    try:
+        fingerprint = file_fingerprint(fp)
+    except OSError:
+        return False
+    return meta.get("size") == fingerprint["size"] and meta.get("mtime_ns") == fingerprint["mtime_ns"]
+
+
+def load_or_build(fp, builder, namespace: str = "dataset"):
+    """
+    Ambil hasil builder(fp) dari cache kalau file sumber belum berubah.
+    - size + mtime sama → langsung pakai cache
+    - size/mtime beda tapi hash konten sama → pakai cache, update meta
+    - selain itu → parse ulang lalu simpan ke cache
+    Return: (data, dari_cache)
+    """
+    fp = Path(fp)
+    if not CACHE_ENABLED:
+        return builder(fp), False
+
+    data_path, meta_path = _cache_paths(fp, namespace)
+    fingerprint = file_fingerprint(fp)
+    meta = _read_meta(meta_path)
+    content_hash = None
+
+    if meta and meta.get("version") == CACHE_VERSION and data_path.exists():
+        same_stat = (
+            meta.get("size") == fingerprint["size"]
+            and meta.get("mtime_ns") == fingerprint["mtime_ns"]
+        )
+        if not same_stat:
+            content_hash = file_hash(fp)
+        if same_stat or meta.get("sha256") == content_hash:
+            try:
+                data = _load_pickle(data_path)
+                if not same_stat:
+                    meta.update(fingerprint)
+                    _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+                return data, True
+            except Exception as e:
+                print(f"[CACHE] Cache rusak untuk {fp.name}, parse ulang: {e}")
+
+    data = builder(fp)
+
+    try:
+        meta = {
+            "version": CACHE_VERSION,
+            "source": fp.as_posix(),
+            "sha256": content_hash or file_hash(fp),
+            **fingerprint,
+        }
+        _write_atomic(data_path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    except Exception as e:
+        print(f"[CACHE] Gagal simpan cache {fp.name}: {e}")
+
+    return data, False
+
+
+def clear_cache(namespace: str = None):
+    folder = CACHE_DIR / namespace if namespace else CACHE_DIR
+    if not folder.exists():
+        return 0
+    removed = 0
+    for p in folder.rglob("*"):
+        if p.is_file() and (p.suffix == ".pkl" or p.name.endswith(".meta.json")):
+            p.unlink()
+            removed += 1
+    return removed
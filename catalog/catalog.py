@@ -0,0 +1,267 @@
+# =====================================================
+# CATALOG — SATU SUMBER DATA PRODUK UNTUK WEB & CHATBOT
+# =====================================================
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from catalog.loader import (
+    load_frames,
+    dataset_signature,
+    frames_version,
+    DatasetLoadError,
+    compact_enabled,
+    compact_dataframe,
+    memory_report,
+    print_memory_report
+)
+from catalog.schema import build_product_schema
+from catalog.search import build_search_index
+from catalog.bitmap import build_bitmap_index
+from catalog.fuzzy import build_trigram_index
+
+
+class Catalog:
+    """
+    Snapshot tabel produk yang sudah dinormalisasi.
+    - product_frame(key) → DataFrame produk unik (dipakai listing & recommend)
+    - frame(key)   → DataFrame per (produk, jenis kulit), direkonstruksi dari skema
+    - records(key) → list of dict per baris (dipakai chatbot)
+    - derived(...) → cache turunan (index, facet, dst) yang nempel di snapshot ini
+
+    Snapshot dianggap immutable: jangan ubah DataFrame-nya langsung,
+    selalu .copy() dulu kalau mau menambah kolom sementara.
+    """
+
+    def __init__(self, frames: dict = None, version: str = "", signature: tuple = (), load_timings: dict = None,
+                 memory: dict = None, schema=None):
+        self.schema = schema if schema is not None else build_product_schema(frames or {})
+        self.categories = [key for key in self.schema.columns if key is not None]
+        self.version = version
+        self.signature = signature
+        self.load_timings = dict(load_timings or {})
+        self.memory = dict(memory or {})
+        self.loaded_at = time.time()
+        self._records = {}
+        self._records_view = None
+        self._derived = {}
+        self._lock = threading.RLock()
+
+    # ---------- Kategori ----------
+    def keys(self):
+        return list(self.categories)
+
+    def __contains__(self, key):
+        return key in self.categories
+
+    def __len__(self):
+        return len(self.categories)
+
+    def __bool__(self):
+        return bool(self.categories)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.schema.product_skin)
+
+    # ---------- Produk unik (tanpa duplikasi per jenis kulit) ----------
+    @property
+    def products(self) -> pd.DataFrame:
+        return self.schema.products
+
+    def product_frame(self, key: str = None) -> pd.DataFrame:
+        if key is not None and key not in self.categories:
+            return pd.DataFrame()
+        return self.schema.product_frame(key)
+
+    # ---------- View listing & facet (dibangun sekali per versi) ----------
+    def listing_frame(self) -> pd.DataFrame:
+        """Tabel produk semua kategori dengan Brand sudah strip + uppercase (dipakai filter halaman)."""
+        return self.derived("listing_frame", _build_listing_frame)
+
+    def brand_list(self) -> list:
+        return self.derived("brand_list", lambda c: _sorted_unique(c.products, "Brand"))
+
+    def category_list(self) -> list:
+        return self.derived("category_list", lambda c: _sorted_unique(c.products, "Kategori"))
+
+    def search_index(self):
+        """Inverted index token/prefix → product_id untuk search & q (lihat catalog.search)."""
+        return self.derived("search_index", lambda c: build_search_index(c.products))
+
+    def bitmap_index(self):
+        """Bitmap per brand / kategori / flag di atas tabel produk (lihat catalog.bitmap)."""
+        return self.derived("bitmap_index", lambda c: build_bitmap_index(c.products))
+
+    def trigram_index(self):
+        """Index trigram kosakata produk untuk fallback pencarian typo (lihat catalog.fuzzy)."""
+        return self.derived("trigram_index", lambda c: build_trigram_index(c.products))
+
+    # ---------- DataFrame view per baris ----------
+    def frame(self, key: str) -> pd.DataFrame:
+        if key not in self.categories:
+            return pd.DataFrame()
+        return self.derived(("rows", key), lambda c: c.schema.rows(key))
+
+    @property
+    def frames(self) -> dict:
+        return {key: self.frame(key) for key in self.categories}
+
+    # ---------- Record view ----------
+    def records(self, key: str) -> list:
+        if key not in self._records:
+            with self._lock:
+                if key not in self._records:
+                    df = self.schema.rows(key) if key in self.categories else None
+                    if df is None:
+                        self._records[key] = []
+                    else:
+                        # category tidak bisa di-fillna("") → ubah ke object dulu
+                        cats = {c: object for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)}
+                        if cats:
+                            df = df.astype(cats)
+                        self._records[key] = df.fillna("").to_dict(orient="records")
+        return self._records[key]
+
+    def records_view(self) -> dict:
+        if self._records_view is None:
+            self._records_view = {key: self.records(key) for key in self.categories}
+        return self._records_view
+
+    # ---------- Cache turunan per versi ----------
+    def derived(self, name: str, builder):
+        """
+        Ambil data turunan (index, facet, dsb) untuk snapshot ini.
+        builder(catalog) cuma dipanggil sekali per snapshot, jadi saat
+        catalog di-reload semua cache turunan otomatis ikut basi.
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._derived:
+                self._derived[name] = builder(self)
+            return self._derived[name]
+
+
+def _sorted_unique(df: pd.DataFrame, col: str) -> list:
+    if col not in df.columns:
+        return []
+    return sorted(df[col].dropna().astype(str).unique().tolist())
+
+
+def _build_listing_frame(catalog: Catalog) -> pd.DataFrame:
+    df = catalog.products.copy()
+    if "Brand" in df.columns:
+        df["Brand"] = df["Brand"].astype(str).str.strip().str.upper()
+    return df
+
+
+def load_catalog(dataset_dir: Path, workers: int = None, compact: bool = None, partial: bool = False) -> Catalog:
+    """
+    Bangun snapshot catalog dari folder dataset.
+    File yang gagal dibaca → DatasetLoadError, kecuali partial=True: snapshot
+    dibangun dari file yang berhasil dan signature-nya dikosongkan supaya
+    watcher mencoba lagi di poll berikutnya.
+    """
+    # signature diambil sebelum baca: kalau file berubah di tengah load, poll berikutnya tetap reload
+    signature = dataset_signature(dataset_dir)
+    timings = {}
+    try:
+        frames = load_frames(dataset_dir, workers=workers, timings=timings)
+    except DatasetLoadError as e:
+        if not partial:
+            raise
+        print(f"[DATASET] Snapshot parsial: {e}")
+        frames, signature = e.frames, None
+    version = frames_version(frames)
+    if timings:
+        slowest = max(timings, key=timings.get)
+        print(f"[DATASET] Total {sum(timings.values()):.3f}s, paling lama: {slowest} ({timings[slowest]:.3f}s)")
+
+    schema = build_product_schema(frames)
+
+    memory = {}
+    if compact is None:
+        compact = compact_enabled()
+    if compact:
+        # sebelum vs sesudah di tabel skema yang sama → yang terukur cuma efek dtype,
+        # bukan ikut penghematan dari pemecahan baris jadi products/product_skin
+        compacted = schema.compact(compact_dataframe)
+        memory = memory_report(schema.tables(), compacted.tables())
+        print_memory_report(memory)
+        schema = compacted
+
+    return Catalog(version=version, signature=signature, load_timings=timings, memory=memory, schema=schema)
+
+
+class CatalogStore:
+    """
+    Pemegang snapshot catalog aktif.
+    Reload dibangun di luar request path lalu di-swap sekali assignment,
+    jadi request yang sedang jalan tetap pakai snapshot lama sampai selesai.
+    """
+
+    def __init__(self, dataset_dir: Path, loader=load_catalog):
+        self.dataset_dir = Path(dataset_dir)
+        self.loader = loader
+        self._current = None
+        self._signature = None
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+        self._stop = threading.Event()
+
+    def current(self) -> Catalog:
+        catalog = self._current
+        if catalog is None:
+            catalog, _ = self.reload()
+        return catalog
+
+    def reload(self, force: bool = False):
+        """Bangun snapshot baru; swap hanya kalau versinya berubah. Return (catalog, berubah)."""
+        with self._reload_lock:
+            old = self._current
+            if old is not None and not force:
+                if dataset_signature(self.dataset_dir) == self._signature:
+                    return old, False
+
+            try:
+                # load pertama boleh parsial (app tetap bisa jalan); reload tidak
+                new = self.loader(self.dataset_dir, partial=old is None)
+            except DatasetLoadError as e:
+                # signature sengaja tidak diupdate → poll berikutnya coba lagi
+                print(f"[CATALOG] Reload gagal, snapshot lama (versi {old.version}) tetap dipakai: {e}")
+                return old, False
+            self._signature = new.signature
+
+            if old is not None and not force and new.version == old.version:
+                # konten sama (cuma mtime berubah) → snapshot lama tetap dipakai
+                return old, False
+
+            self._current = new
+            print(f"[CATALOG] Snapshot aktif: versi {new.version} ({len(new.products)} produk, {new.row_count} baris)")
+            return new, True
+
+    # ---------- Watcher background ----------
+    def start_watcher(self, interval: float = 5.0):
+        if self._watcher is not None and self._watcher.is_alive():
+            return self._watcher
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.reload()
+                except Exception as e:
+                    print(f"[CATALOG] Gagal reload otomatis: {e}")
+
+        self._stop.clear()
+        self._watcher = threading.Thread(target=loop, name="catalog-watcher", daemon=True)
+        self._watcher.start()
+        print(f"[CATALOG] Watcher aktif (cek tiap {interval} detik)")
+        return self._watcher
+
+    def stop_watcher(self):
+        self._stop.set()
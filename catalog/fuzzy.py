@@ -0,0 +1,111 @@
+# =====================================================
+# FUZZY SEARCH (TRIGRAM) UNTUK QUERY YANG TYPO
+# =====================================================
+# Dipakai sebagai fallback kalau pencarian substring biasa tidak menemukan
+# apa-apa ("moisturiser", "azarin"). Kosakata token catalog dipecah jadi
+# trigram; token query dicocokkan ke kosakata lewat jumlah trigram yang sama,
+# lalu diranking pakai similarity (mirip pg_trgm: |A∩B| / |A∪B|).
+# Jumlah kandidat token, produk per kandidat, dan hasil akhir dibatasi supaya
+# latency tetap datar walau catalog membesar.
+from collections import Counter
+
+import pandas as pd
+
+from catalog.text import clean_text
+from catalog.search import SEARCH_FIELDS
+
+# batas kandidat token kosakata per token query, produk yang diambil per
+# kandidat token (per field) & ambang similarity
+MAX_TOKEN_CANDIDATES = 32
+MAX_TOKEN_PRODUCTS = 500
+MIN_SIMILARITY = 0.3
+MAX_RESULTS = 60
+
+
+def trigrams(token: str) -> set:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+class TrigramIndex:
+    def __init__(self, df: pd.DataFrame, fields: list = None):
+        self.fields = [f for f in (fields or SEARCH_FIELDS) if f in df.columns]
+        self.vocab = []          # token_id → token
+        self.vocab_grams = []    # token_id → set trigram
+        self.products = []       # token_id → {field: [product_id, ...]}
+        self.postings = {}       # trigram → [token_id, ...]
+        token_ids = {}
+
+        for field in self.fields:
+            for pid, val in zip(df.index.tolist(), df[field].tolist()):
+                text = "" if pd.isna(val) else str(val)
+                for tok in set(clean_text(text).split()):
+                    tid = token_ids.get(tok)
+                    if tid is None:
+                        tid = token_ids[tok] = len(self.vocab)
+                        grams = trigrams(tok)
+                        self.vocab.append(tok)
+                        self.vocab_grams.append(grams)
+                        self.products.append({})
+                        for g in grams:
+                            self.postings.setdefault(g, []).append(tid)
+                    self.products[tid].setdefault(field, []).append(pid)
+
+    def similar_tokens(self, token: str) -> list:
+        """[(token_id, similarity)] kosakata yang mirip dengan token query."""
+        grams = trigrams(token)
+        shared = Counter()
+        for g in grams:
+            shared.update(self.postings.get(g, ()))
+        result = []
+        for tid, _ in shared.most_common(MAX_TOKEN_CANDIDATES):
+            sim = similarity(grams, self.vocab_grams[tid])
+            if sim >= MIN_SIMILARITY:
+                result.append((tid, sim))
+        return result
+
+    def lookup(self, query: str, fields: list = None, limit: int = MAX_RESULTS) -> list:
+        """
+        [(product_id, skor)] urut skor tertinggi. Skor = rata-rata similarity
+        terbaik tiap token query di field yang diminta (token tanpa padanan = 0).
+        """
+        tokens = clean_text(query or "").split()
+        if not tokens:
+            return []
+        fields = fields or self.fields
+
+        scores = {}
+        for tok in tokens:
+            best = {}
+            for tid, sim in self.similar_tokens(tok):
+                for field in fields:
+                    for pid in self.products[tid].get(field, ())[:MAX_TOKEN_PRODUCTS]:
+                        if sim > best.get(pid, 0.0):
+                            best[pid] = sim
+            for pid, sim in best.items():
+                scores[pid] = scores.get(pid, 0.0) + sim
+
+        ranked = [(pid, total / len(tokens)) for pid, total in scores.items()]
+        ranked = [item for item in ranked if item[1] >= MIN_SIMILARITY]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def rank(self, df: pd.DataFrame, query: str, fields: list = None, limit: int = MAX_RESULTS) -> pd.DataFrame:
+        """Baris df (ber-index product_id) yang mirip query, urut similarity."""
+        ranked = self.lookup(query, fields, limit=None)
+        if not ranked:
+            return df.iloc[0:0]
+        pos = df.index.get_indexer([pid for pid, _ in ranked])
+        pos = pos[pos >= 0]
+        return df.iloc[pos[:limit] if limit else pos]
+
+
+def build_trigram_index(df: pd.DataFrame, fields: list = None) -> TrigramIndex:
+    return TrigramIndex(df, fields)
@@ -0,0 +1,338 @@
+# =====================================================
+# LOADER DATASET PRODUK (XLSX → DATAFRAME NORMAL)
+# =====================================================
+import hashlib
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+# pyarrow opsional: kalau ada, teks bebas disimpan sebagai string[pyarrow]
+try:
+    import pyarrow
+except Exception:
+    pyarrow = None
+
+from catalog.text import add_text_columns
+from catalog.cache import load_or_build, is_fresh, file_fingerprint, file_hash, CACHE_VERSION
+
+# Urutan kategori mengikuti urutan skincare routine,
+# dipakai supaya hasil load selalu deterministik.
+CATEGORY_ORDER = ["facialwash", "toner", "serum", "moisturizer", "sunscreen"]
+
+
+class DatasetLoadError(Exception):
+    """Ada file dataset yang gagal dibaca. `frames` = hasil parsial dari file yang berhasil."""
+
+    def __init__(self, failed: dict, frames: dict):
+        self.failed = dict(failed)   # nama file → exception
+        self.frames = frames
+        names = ", ".join(f"{name}: {err}" for name, err in self.failed.items())
+        super().__init__(f"{len(self.failed)} file dataset gagal dibaca ({names})")
+
+
+def normalize_key(text: str) -> str:
+    return normalize_filename(text).lower()
+
+
+def normalize_filename(name: str) -> str:
+    name = name.lower().strip()
+    name = name.replace(" ", "_")
+    name = re.sub(r"[+]+", "", name)   # HAPUS +++
+    name = re.sub(r"[^a-z0-9_]", "", name)  # HAPUS karakter aneh
+    name = re.sub(r"_+", "_", name)
+    return name
+
+
+def category_key(stem: str) -> str:
+    key = normalize_key(stem)
+
+    if "facial" in key: key = "facialwash"
+    elif "moist" in key: key = "moisturizer"
+    elif "serum" in key: key = "serum"
+    elif "sun" in key: key = "sunscreen"
+    elif "toner" in key: key = "toner"
+
+    return key
+
+
+def category_sort_key(key: str):
+    if key in CATEGORY_ORDER:
+        return (0, CATEGORY_ORDER.index(key), key)
+    return (1, 0, key)
+
+
+def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    # bersihkan nama kolom (strip) lalu rename beberapa variasi ke nama kolom standar
+    cols = {c: c.strip() for c in df.columns}
+    df = df.rename(columns=cols)
+
+    # Lower-case map detection
+    colmap = {}
+    for c in df.columns:
+        lc = c.lower()
+        if "nama" in lc and "produk" in lc:
+            colmap[c] = "Nama Produk"
+        elif lc == "name" or lc == "nama":
+            colmap[c] = "Nama Produk"
+        elif "brand" in lc:
+            colmap[c] = "Brand"
+        elif "kandung" in lc or "kandungan" in lc:
+            colmap[c] = "Kandungan Utama"
+        elif "gambar" in lc or lc == "image" or lc == "images":
+            colmap[c] = "Gambar"
+        elif "jenis" in lc and "kulit" in lc:
+            colmap[c] = "Jenis Kulit"
+        elif "masalah" in lc:
+            colmap[c] = "Masalah Kulit"
+        elif "score" in lc:
+            colmap[c] = "Score"
+        elif "catat" in lc or "note" in lc:
+            colmap[c] = "Catatan"
+        elif "alcohol" in lc:
+            colmap[c] = "Alcohol-Free"
+        elif "fragrance" in lc or "parfum" in lc:
+            colmap[c] = "Fragrance-Free"
+        elif "comed" in lc or ("non" in lc and "comedo" in lc):
+            colmap[c] = "Non-Comedogenic"
+
+    if colmap:
+        df = df.rename(columns=colmap)
+
+    for must in ["Nama Produk", "Brand", "Kandungan Utama", "Gambar", "Kategori", "Jenis Kulit", "Masalah Kulit"]:
+        if must not in df.columns:
+            df[must] = ""
+
+    for col in ["Alcohol-Free", "Fragrance-Free", "Non-Comedogenic"]:
+        if col in df.columns:
+            df[col] = df[col].astype(str).str.strip().str.lower().isin(["yes", "true", "1"])
+        else:
+            df[col] = False
+
+    return df
+
+
+# Kolom dengan nilai sedikit & berulang → dtype category
+CATEGORY_COLUMNS = ["Brand", "Kategori", "Jenis Kulit", "__jenis_norm", "__jenis_text", "__brand_text"]
+# Kolom teks bebas → string[pyarrow] (atau string biasa kalau pyarrow tidak ada)
+TEXT_COLUMNS = ["Nama Produk", "Kandungan Utama", "Masalah Kulit", "Gambar", "Catatan",
+                "__kandungan_norm", "__m_norm", "__masalah_text", "__kandungan_text"]
+BOOL_VALUES = {"yes": True, "true": True, "1": True, "no": False, "false": False, "0": False, "": False, "nan": False}
+
+
+def compact_enabled() -> bool:
+    return os.getenv("SKINALYZE_CATALOG_COMPACT", "").strip().lower() in ["1", "true", "yes", "on"]
+
+
+def compact_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Versi hemat memori dari output normalize_dataframe():
+    - category untuk kolom berulang (Brand, Kategori, Jenis Kulit, dst)
+    - string[pyarrow] untuk teks bebas (NaN diganti "" biar aman dipakai `or`)
+    - bool asli untuk kolom YES/NO (Oil Control, Hydrating, dst)
+    """
+    df = df.copy()
+    string_dtype = "string[pyarrow]" if pyarrow is not None else "string"
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna("").astype(str).astype(string_dtype)
+
+    for col in df.columns:
+        if col in CATEGORY_COLUMNS or col in TEXT_COLUMNS or df[col].dtype == bool:
+            continue
+        if df[col].dtype != object and not pd.api.types.is_string_dtype(df[col]):
+            continue
+        lowered = df[col].fillna("").astype(str).str.strip().str.lower()
+        if lowered.isin(BOOL_VALUES.keys()).all():
+            df[col] = lowered.map(BOOL_VALUES).astype(bool)
+
+    return df
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def memory_report(before: dict, after: dict) -> dict:
+    """Bandingkan footprint kumpulan DataFrame sebelum vs sesudah (nama tabel boleh beda)."""
+    b = {key: frame_memory(df) for key, df in before.items()}
+    a = {key: frame_memory(df) for key, df in after.items()}
+    return {
+        "before": b,
+        "after": a,
+        "before_bytes": sum(b.values()),
+        "after_bytes": sum(a.values()),
+    }
+
+
+def print_memory_report(report: dict):
+    for key, size in report["before"].items():
+        print(f"[MEMORY] sebelum  {key}: {size / 1024:.1f} KB")
+    for key, size in report["after"].items():
+        print(f"[MEMORY] sesudah  {key}: {size / 1024:.1f} KB")
+    before, after = report["before_bytes"], report["after_bytes"]
+    ratio = (after / before * 100) if before else 0
+    print(f"[MEMORY] TOTAL: {before / 1024:.1f} KB → {after / 1024:.1f} KB ({ratio:.0f}%)")
+
+
+def read_dataset_file(fp: Path) -> pd.DataFrame:
+    df = pd.read_excel(fp, engine="openpyxl")
+    df.columns = df.columns.str.strip().str.lower()
+    df = normalize_dataframe(df)
+    df["Kategori"] = category_key(Path(fp).stem)
+    return add_text_columns(df)
+
+
+def dataset_files(dataset_dir: Path):
+    files = []
+    for fp in sorted(Path(dataset_dir).glob("*.xlsx")):
+        if fp.name.startswith("~$"):  # skip temporary Excel file
+            continue
+        files.append(fp)
+    return files
+
+
+def dataset_signature(dataset_dir: Path) -> tuple:
+    """Sidik jari murah (nama, size, mtime) — dipakai watcher untuk deteksi perubahan."""
+    sig = []
+    for fp in dataset_files(dataset_dir):
+        try:
+            fpr = file_fingerprint(fp)
+        except OSError:
+            continue
+        sig.append((fp.name, fpr["size"], fpr["mtime_ns"]))
+    return tuple(sig)
+
+
+def dataset_version(dataset_dir: Path) -> str:
+    """Versi catalog dari hash konten file → sama di semua worker untuk data yang sama."""
+    h = hashlib.sha256(f"v{CACHE_VERSION}".encode("ascii"))
+    for fp in dataset_files(dataset_dir):
+        try:
+            h.update(fp.name.encode("utf-8"))
+            h.update(file_hash(fp).encode("ascii"))
+        except OSError:
+            continue
+    return h.hexdigest()[:16]
+
+
+def frames_version(frames: dict) -> str:
+    """Versi catalog dari isi DataFrame yang benar-benar termuat (bukan dari file di disk)."""
+    h = hashlib.sha256(f"v{CACHE_VERSION}".encode("ascii"))
+    for key, df in frames.items():
+        # kolom turunan "__..." (set token) diturunkan dari kolom lain dan urutan
+        # iterasinya tidak stabil antar proses → tidak ikut di-hash
+        df = df[[c for c in df.columns if not str(c).startswith("__")]]
+        h.update(str(key).encode("utf-8"))
+        h.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return h.hexdigest()[:16]
+
+
+def load_dataset_file(fp: Path):
+    """Worker: baca satu file (pakai cache kalau ada). Harus top-level biar bisa di-pickle."""
+    start = time.perf_counter()
+    df, from_cache = load_or_build(fp, read_dataset_file, namespace="dataset")
+    return df, from_cache, time.perf_counter() - start
+
+
+def default_workers(n_files: int) -> int:
+    env = os.getenv("SKINALYZE_LOAD_WORKERS", "").strip()
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            pass
+    return max(1, min(n_files, os.cpu_count() or 1))
+
+
+def pool_context():
+    """
+    Context multiprocessing untuk pool loader: hanya fork. Dengan spawn/forkserver
+    (default Windows & macOS) tiap worker meng-import ulang __main__ (app.py:
+    hash static, load catalog, buka pool lagi) → lebih lambat dari load serial.
+    None = platform tanpa fork → load serial.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _load_parallel(files, workers: int, context) -> dict:
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(load_dataset_file, fp): fp for fp in files}
+        for fut in futures:
+            fp = futures[fut]
+            try:
+                results[fp] = fut.result()
+            except Exception as e:
+                results[fp] = e
+    return results
+
+
+def load_frames(dataset_dir: Path, workers: int = None, timings: dict = None) -> dict:
+    """
+    Baca semua file xlsx di folder dataset → {kategori: DataFrame}.
+    - File yang cache-nya masih fresh dibaca langsung (pickle, cepat)
+    - Sisanya di-parse paralel pakai ProcessPoolExecutor (openpyxl CPU-bound)
+    - workers=1, platform tanpa fork, pool gagal, atau file yang gagal di worker → serial
+    Hasil digabung dengan urutan kategori yang tetap (CATEGORY_ORDER).
+    Kalau ada file yang gagal dibaca → DatasetLoadError (hasil parsial ada di .frames).
+    """
+    frames = {}
+    dataset_dir = Path(dataset_dir)
+    if not dataset_dir.exists():
+        print("[DATASET] Folder dataset tidak ditemukan:", dataset_dir)
+        return frames
+
+    files = dataset_files(dataset_dir)
+    stale = [fp for fp in files if not is_fresh(fp, namespace="dataset")]
+    workers = default_workers(len(stale)) if workers is None else max(1, workers)
+
+    results = {}
+    context = pool_context()
+    if len(stale) > 1 and workers > 1 and context is not None:
+        try:
+            results = _load_parallel(stale, workers, context)
+        except Exception as e:
+            print(f"[DATASET] Process pool gagal, fallback serial: {e}")
+            results = {}
+
+    for fp in files:
+        if isinstance(results.get(fp), Exception):
+            print(f"[DATASET] Worker gagal baca {fp.name}, ulang serial: {results[fp]}")
+        if fp not in results or isinstance(results[fp], Exception):
+            try:
+                results[fp] = load_dataset_file(fp)
+            except Exception as e:
+                results[fp] = e
+
+    failed = {}
+    for fp in files:
+        res = results[fp]
+        if isinstance(res, Exception):
+            print(f"[DATASET] Gagal baca {fp.name}: {res}")
+            failed[fp.name] = res
+            continue
+        df, from_cache, seconds = res
+        key = category_key(fp.stem)
+        frames[key] = df
+        if timings is not None:
+            timings[fp.name] = seconds
+        sumber = "cache" if from_cache else "xlsx"
+        print(f"[DATASET] Muat: {fp.name} ({len(df)} baris, {sumber}, {seconds:.3f}s) → key: {key}")
+
+    frames = {k: frames[k] for k in sorted(frames, key=category_sort_key)}
+    if failed:
+        raise DatasetLoadError(failed, frames)
+    return frames
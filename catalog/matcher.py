@@ -0,0 +1,59 @@
+# =====================================================
+# MULTI-PATTERN MATCHER (AHO–CORASICK)
+# =====================================================
+# Dipakai untuk aturan manfaat kandungan: dulu tiap card mengecek
+# `ingredient in kandungan` untuk ~200 key satu per satu. Di sini semua key
+# dikompilasi sekali jadi automaton Aho–Corasick (trie + failure link,
+# lalu dijadikan tabel transisi penuh), jadi semua key yang muncul sebagai
+# substring ketemu dalam satu kali scan teks — biaya ∝ panjang teks,
+# bukan jumlah aturan.
+from collections import deque
+
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        """keywords: iterable string (mis. key dict aturan); urutan aslinya dipertahankan."""
+        self.keywords = list(dict.fromkeys(keywords))
+
+        # 1. Trie
+        goto = [{}]
+        out = [set()]
+        for i, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(set())
+                state = nxt
+            out[state].add(i)
+
+        # 2. Failure link (BFS) + tabel transisi penuh: transisi yang tidak ada
+        #    di trie diwarisi dari state failure-nya, jadi scan tanpa loop fallback
+        fail = [0] * len(goto)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                out[nxt] |= out[fail[nxt]]
+                queue.append(nxt)
+
+        self._delta = delta
+        self._out = [frozenset(o) for o in out]
+
+    def find(self, text: str) -> list:
+        """Semua keyword yang muncul di `text`, urut sesuai urutan keyword asli."""
+        delta, out = self._delta, self._out
+        state = 0
+        found = set()
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return [self.keywords[i] for i in sorted(found)]
@@ -0,0 +1,177 @@
+# =====================================================
+# SKEMA PRODUK — 1 BARIS PER PRODUK + MAPPING PRODUK → JENIS KULIT
+# =====================================================
+# Dataset asli menyimpan satu baris untuk setiap pasangan (produk, jenis kulit),
+# jadi tiap produk muncul berkali-kali. Di sini dipecah menjadi:
+#   products      → satu baris per produk (index = product_id)
+#   skin_types    → satu baris per jenis kulit (index = skin_id)
+#   product_skin  → pasangan (product_id, skin_id) + kolom yang beda per baris
+#                   untuk sebagian besar produk (No, cocok)
+#   overrides     → nilai per pasangan hanya untuk produk yang memang beda
+#                   (mis. 1 sunscreen dengan 2 tulisan kandungan); kolomnya
+#                   tetap disimpan sekali per produk di `products`
+# Baris asli tetap bisa direkonstruksi lewat rows() untuk chatbot.
+import numpy as np
+import pandas as pd
+
+PRODUCT_KEY = ["Kategori", "Brand", "Nama Produk"]
+SKIN_COLUMNS = ["Jenis Kulit", "__jenis_norm", "__jenis_tokens", "__jenis_text"]
+# kolom disimpan per baris di product_skin kalau baris dari produk yang nilainya
+# beda sudah >= rasio ini; di bawahnya cukup override untuk produk yang beda saja
+PAIR_DENSE_RATIO = 0.5
+
+
+def _factorize(df: pd.DataFrame, cols: list):
+    keys = df[cols].astype(object).where(df[cols].notna(), "")
+    codes, _ = pd.MultiIndex.from_frame(keys).factorize()
+    return codes
+
+
+def _with_overrides(col: pd.Series, pos, values) -> pd.Series:
+    """Salinan `col` dengan nilai di posisi `pos` diganti `values` (dtype kolom dipertahankan)."""
+    col = col.copy()
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        new = pd.Index(pd.unique(values)).dropna().difference(col.cat.categories)
+        if len(new):
+            col = col.cat.add_categories(new)
+    col.iloc[pos] = values
+    return col
+
+
+class ProductSchema:
+    def __init__(self, products: pd.DataFrame, skin_types: pd.DataFrame, product_skin: pd.DataFrame, columns: dict,
+                 overrides: pd.DataFrame = None):
+        self.products = products
+        self.skin_types = skin_types
+        self.product_skin = product_skin
+        self.columns = columns
+        # index = index baris product_skin, kolom = kolom yang di-override
+        self.overrides = overrides if overrides is not None else pd.DataFrame(index=pd.RangeIndex(0))
+        self._by_category = {}
+        self._frames_by_category = {}
+        if not products.empty:
+            for key, grp in products.groupby("Kategori", sort=False, observed=True):
+                ids = grp.index.to_numpy()
+                self._by_category[key] = ids
+                # produk satu kategori selalu berurutan → cukup slice (tanpa copy)
+                pos = products.index.get_indexer(ids)
+                if len(pos) and pos[-1] - pos[0] + 1 == len(pos):
+                    self._frames_by_category[key] = products.iloc[pos[0]:pos[-1] + 1]
+                else:
+                    self._frames_by_category[key] = products.loc[ids]
+
+    def tables(self) -> dict:
+        return {"products": self.products, "skin_types": self.skin_types, "product_skin": self.product_skin,
+                "overrides": self.overrides}
+
+    def compact(self, compact_fn):
+        """Skema baru dengan tabel yang sudah di-compact (lihat compact_dataframe)."""
+        return ProductSchema(
+            compact_fn(self.products),
+            compact_fn(self.skin_types),
+            compact_fn(self.product_skin),
+            self.columns,
+            compact_fn(self.overrides),
+        )
+
+    # ---------- Produk unik ----------
+    def product_ids(self, kategori: str = None) -> np.ndarray:
+        if kategori is None:
+            return self.products.index.to_numpy()
+        return self._by_category.get(kategori, np.array([], dtype=np.int64))
+
+    def product_frame(self, kategori: str = None) -> pd.DataFrame:
+        if kategori is None:
+            return self.products
+        return self._frames_by_category.get(kategori, self.products.iloc[0:0])
+
+    # ---------- Jenis kulit ----------
+    def skin_ids_containing(self, text: str) -> np.ndarray:
+        """skin_id yang teks normalnya mengandung `text` (sama seperti str.contains lama)."""
+        norm = self.skin_types["__jenis_norm"].astype(str)
+        return self.skin_types.index[norm.str.contains(text, regex=False)].to_numpy()
+
+    def product_ids_for_skins(self, skin_ids) -> np.ndarray:
+        ps = self.product_skin
+        return pd.unique(ps.loc[ps["skin_id"].isin(skin_ids), "product_id"].to_numpy())
+
+    # ---------- Rekonstruksi baris asli ----------
+    def rows(self, kategori: str = None) -> pd.DataFrame:
+        ps = self.product_skin
+        if kategori is not None:
+            ps = ps[ps["product_id"].isin(self.product_ids(kategori))]
+        base = self.products.loc[ps["product_id"].to_numpy()].reset_index(drop=True)
+        skin = self.skin_types.loc[ps["skin_id"].to_numpy()].reset_index(drop=True)
+        pair_cols = [c for c in ps.columns if c not in ("product_id", "skin_id")]
+        overrides = self.overrides[self.overrides.index.isin(ps.index)]
+        override_pos = ps.index.get_indexer(overrides.index)
+        ps = ps.reset_index(drop=True)
+        # assign Series (index sama) supaya dtype asli ikut terbawa
+        for col in SKIN_COLUMNS:
+            if col in skin.columns:
+                base[col] = skin[col]
+        for col in pair_cols:
+            base[col] = ps[col]
+        if len(overrides):
+            for col in overrides.columns:
+                base[col] = _with_overrides(base[col], override_pos, overrides[col].to_numpy(dtype=object))
+        columns = self.columns.get(kategori) or self.columns.get(None, [])
+        return base[[c for c in columns if c in base.columns]]
+
+
+def build_product_schema(frames: dict) -> ProductSchema:
+    """Tahap ingestion: pecah {kategori: DataFrame per baris} jadi tabel produk + mapping."""
+    # tiap kategori bisa punya kolom berbeda → simpan urutan kolom aslinya
+    column_map = {key: list(df.columns) for key, df in frames.items()}
+    frames = [df for df in frames.values() if not df.empty]
+    if not frames:
+        empty = pd.DataFrame()
+        return ProductSchema(empty, empty, pd.DataFrame(columns=["product_id", "skin_id"]), column_map)
+
+    all_rows = pd.concat(frames, ignore_index=True)
+    columns = list(all_rows.columns)
+    column_map[None] = columns
+
+    for col in PRODUCT_KEY + ["Jenis Kulit"]:
+        if col not in all_rows.columns:
+            all_rows[col] = ""
+
+    product_codes = _factorize(all_rows, PRODUCT_KEY)
+    skin_codes = _factorize(all_rows, ["Jenis Kulit"])
+
+    # Kolom yang nilainya bisa beda antar baris produk yang sama: kalau bedanya di
+    # sebagian besar produk → kolom per pasangan, kalau cuma segelintir → override
+    other_cols = [c for c in columns if c not in SKIN_COLUMNS]
+    grouped = all_rows[other_cols].groupby(product_codes, sort=False)
+    pair_cols, override_rows = [], {}
+    for c in other_cols:
+        if c in PRODUCT_KEY:
+            continue
+        varies = grouped[c].nunique(dropna=False) > 1
+        if not varies.any():
+            continue
+        rows = np.flatnonzero(np.isin(product_codes, varies.index[varies]))
+        if len(rows) >= PAIR_DENSE_RATIO * len(all_rows):
+            pair_cols.append(c)
+        else:
+            override_rows[c] = rows
+
+    first = pd.Series(product_codes).drop_duplicates(keep="first")
+    products = all_rows.loc[first.index, other_cols].copy()
+    products.index = pd.Index(first.to_numpy(), name="product_id")
+    products = products.sort_index()
+
+    first_skin = pd.Series(skin_codes).drop_duplicates(keep="first")
+    skin_types = all_rows.loc[first_skin.index, [c for c in SKIN_COLUMNS if c in all_rows.columns]].copy()
+    skin_types.index = pd.Index(first_skin.to_numpy(), name="skin_id")
+    skin_types = skin_types.sort_index()
+
+    product_skin = all_rows[pair_cols].copy()
+    product_skin.insert(0, "skin_id", skin_codes)
+    product_skin.insert(0, "product_id", product_codes)
+
+    # baris produk yang beda saja; kolom lain di baris itu sama dengan nilai produknya
+    rows = np.unique(np.concatenate(list(override_rows.values()))) if override_rows else np.array([], dtype=np.int64)
+    overrides = all_rows.loc[rows, list(override_rows)].copy()
+
+    return ProductSchema(products, skin_types, product_skin, column_map, overrides)
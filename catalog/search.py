@@ -0,0 +1,96 @@
+# =====================================================
+# INVERTED INDEX PENCARIAN PRODUK (BRAND, NAMA, KANDUNGAN)
+# =====================================================
+# Dibangun sekali per versi catalog. Tiap token dinormalisasi (clean_text),
+# lalu semua prefix-nya — termasuk prefix dari tiap suffix token — dipetakan
+# ke product_id. Dengan begitu query "niacin" maupun "cinamide" tetap ketemu
+# seperti str.contains lama, tapi tanpa scan seluruh catalog.
+# Panjang potongan dibatasi MAX_KEY_LENGTH (key per token ∝ L·K, bukan L²);
+# token query yang lebih panjang dicari lewat irisan semua potongan sepanjang
+# MAX_KEY_LENGTH-nya → hasilnya kandidat, pemanggil tetap cek substring.
+import re
+
+import numpy as np
+import pandas as pd
+
+from catalog.text import clean_text
+
+SEARCH_FIELDS = ["Brand", "Nama Produk", "Kandungan Utama"]
+
+# query yang mengandung metakarakter regex tetap dijawab scan biasa
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+_EMPTY = np.array([], dtype=np.int64)
+MAX_KEY_LENGTH = 12
+
+
+def token_keys(token: str):
+    """Semua potongan token sampai MAX_KEY_LENGTH char (prefix dari tiap suffix) → key posting list."""
+    for i in range(len(token)):
+        for j in range(i + 1, min(len(token), i + MAX_KEY_LENGTH) + 1):
+            yield token[i:j]
+
+
+def query_keys(token: str) -> list:
+    """Key yang harus ada semua untuk token query: token itu sendiri, atau potongan MAX_KEY_LENGTH-nya."""
+    if len(token) <= MAX_KEY_LENGTH:
+        return [token]
+    return list(dict.fromkeys(token[i:i + MAX_KEY_LENGTH] for i in range(len(token) - MAX_KEY_LENGTH + 1)))
+
+
+class SearchIndex:
+    def __init__(self, df: pd.DataFrame, fields: list = None):
+        self.fields = [f for f in (fields or SEARCH_FIELDS) if f in df.columns]
+        self.postings = {}
+        for field in self.fields:
+            post = {}
+            for pid, val in zip(df.index.to_numpy(), df[field].to_numpy()):
+                text = "" if pd.isna(val) else str(val)
+                keys = set()
+                for tok in set(clean_text(text).split()):
+                    keys.update(token_keys(tok))
+                for key in keys:
+                    post.setdefault(key, []).append(pid)
+            self.postings[field] = {key: np.array(ids, dtype=np.int64) for key, ids in post.items()}
+
+    def __len__(self):
+        return sum(len(post) for post in self.postings.values())
+
+    def lookup(self, query: str, fields: list = None):
+        """
+        product_id kandidat untuk `query` (sorted), atau None kalau query
+        tidak bisa dijawab index (kosong / regex) → pemanggil scan biasa.
+        Kandidat = produk yang semua token query-nya muncul di satu field
+        (token > MAX_KEY_LENGTH dicocokkan lewat potongannya, jadi bisa lebih longgar).
+        """
+        if not query or _REGEX_META.search(query):
+            return None
+        tokens = clean_text(query).split()
+        if not tokens:
+            return None
+
+        result = _EMPTY
+        for field in (fields or self.fields):
+            post = self.postings.get(field)
+            if post is None:
+                return None
+            ids = None
+            for key in dict.fromkeys(k for tok in tokens for k in query_keys(tok)):
+                hit = post.get(key, _EMPTY)
+                ids = hit if ids is None else np.intersect1d(ids, hit, assume_unique=True)
+                if not len(ids):
+                    break
+            result = np.union1d(result, ids)
+        return result
+
+    def candidates(self, df: pd.DataFrame, query: str, fields: list = None) -> pd.DataFrame:
+        """Persempit df ke baris kandidat (urutan df tetap). df harus ber-index product_id."""
+        ids = self.lookup(query, fields)
+        if ids is None:
+            return df
+        pos = df.index.get_indexer(ids)
+        pos = np.sort(pos[pos >= 0])
+        return df.iloc[pos]
+
+
+def build_search_index(df: pd.DataFrame, fields: list = None) -> SearchIndex:
+    return SearchIndex(df, fields)
@@ -0,0 +1,47 @@
+# =====================================================
+# SERIALISASI FRAME → LIST OF DICT (TANPA ITERROWS)
+# =====================================================
+# iterrows() bikin satu Series per baris (lambat + dtype campur aduk).
+# Di sini tiap kolom diambil sekali sebagai list Python (.tolist() sudah
+# mengubah numpy scalar → int/bool/str biasa), lalu dirakit per baris pakai zip.
+import pandas as pd
+
+
+def column_values(df: pd.DataFrame, col: str, default=""):
+    """Satu kolom → list Python siap JSON (NaN → default, kolom tidak ada → default)."""
+    if col not in df.columns:
+        return [default] * len(df)
+    s = df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        s = s.astype(object)
+    if pd.api.types.is_bool_dtype(s.dtype):
+        return s.tolist()
+    if s.isna().any():
+        s = s.astype(object).where(s.notna(), default)
+    return s.tolist()
+
+
+def frame_records(df: pd.DataFrame, columns: dict, defaults: dict = None) -> list:
+    """
+    Proyeksikan df ke {key_output: kolom_sumber} lalu rakit jadi list of dict.
+    Contoh: frame_records(df, {"nama": "Nama Produk", "brand": "Brand"})
+    """
+    defaults = defaults or {}
+    keys = list(columns)
+    values = [column_values(df, columns[key], defaults.get(key, "")) for key in keys]
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def flag_values(df: pd.DataFrame, col: str) -> list:
+    """Kolom flag → list bool murni (kolom tidak ada → False semua)."""
+    if col not in df.columns:
+        return [False] * len(df)
+    return (df[col] == True).tolist()
+
+
+def safety_scores(df: pd.DataFrame, cols: list) -> pd.Series:
+    """Jumlah flag yang bernilai True per baris (pengganti apply(axis=1))."""
+    present = [c for c in cols if c in df.columns]
+    if not present:
+        return pd.Series(0, index=df.index, dtype="int64")
+    return df[present].eq(True).sum(axis=1).astype("int64")
@@ -0,0 +1,102 @@
+# =====================================================
+# AUTOCOMPLETE (PREFIX) UNTUK KOTAK PENCARIAN
+# =====================================================
+# Dibangun sekali per versi catalog dari brand, nama produk, dan nama kanonik
+# kandungan (INGREDIENT_SYNONYMS). Tiap label dinormalisasi lalu dimasukkan
+# ke array terurut di bawah teks penuh + tiap awal kata ("serum" juga
+# menemukan "Radiant Resurfacing Serum"). Lookup = dua bisect → rentang,
+# diranking pakai frekuensi di catalog. Prefix pendek (rentang besar) sudah
+# dihitung hasilnya saat build, jadi tiap lookup tetap orde mikrodetik.
+from bisect import bisect_left
+
+import pandas as pd
+
+from catalog.text import clean_text
+
+DEFAULT_SUGGESTIONS = 8
+MAX_SUGGESTIONS = 20
+# prefix sepanjang ini atau kurang → top-k sudah dihitung saat build
+SHORT_PREFIX = 3
+
+KIND_BRAND = "brand"
+KIND_PRODUCT = "produk"
+KIND_INGREDIENT = "kandungan"
+# urutan tampil kalau frekuensi sama
+_KIND_ORDER = {KIND_BRAND: 0, KIND_INGREDIENT: 1, KIND_PRODUCT: 2}
+
+
+class SuggestIndex:
+    def __init__(self, entries: list):
+        """entries: [(label, kind, count)]"""
+        self.entries = entries
+        self.norms = [clean_text(label) for label, _, _ in entries]
+        keyed = []
+        for eid, norm in enumerate(self.norms):
+            words = norm.split()
+            for i in range(len(words)):
+                keyed.append((" ".join(words[i:]), eid))
+        keyed.sort()
+        self.keys = [key for key, _ in keyed]
+        self.ids = [eid for _, eid in keyed]
+
+        self.short = {}
+        for prefix in {key[:n] for key in self.keys for n in range(1, SHORT_PREFIX + 1)}:
+            self.short[prefix] = self._scan(prefix, MAX_SUGGESTIONS)
+
+    def _rank_key(self, eid: int, prefix: str):
+        label, kind, count = self.entries[eid]
+        # label yang diawali prefix (bukan kata tengah) didahulukan
+        starts = self.norms[eid].startswith(prefix)
+        return (-count, not starts, _KIND_ORDER[kind], len(label), label)
+
+    def _scan(self, prefix: str, k: int) -> list:
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + "\uffff", lo)
+        found = set(self.ids[lo:hi])
+        return sorted(found, key=lambda eid: self._rank_key(eid, prefix))[:k]
+
+    def lookup(self, prefix: str, k: int = DEFAULT_SUGGESTIONS) -> list:
+        """[{label, type, count}] top-k untuk prefix (dinormalisasi dulu pakai clean_text)."""
+        prefix = clean_text(prefix or "")
+        if not prefix:
+            return []
+        k = max(1, min(k, MAX_SUGGESTIONS))
+        if len(prefix) <= SHORT_PREFIX:
+            found = self.short.get(prefix, [])[:k]
+        else:
+            found = self._scan(prefix, k)
+        return [
+            {"label": label, "type": kind, "count": count}
+            for label, kind, count in (self.entries[eid] for eid in found)
+        ]
+
+
+def build_suggest_index(products: pd.DataFrame, search_index, ingredients: dict = None) -> SuggestIndex:
+    """
+    products: tabel produk (1 baris per produk). search_index dipakai untuk
+    menghitung berapa produk yang mengandung tiap kandungan kanonik.
+    """
+    entries = []
+
+    if "Brand" in products.columns:
+        brands = products["Brand"].dropna().astype(str).str.strip()
+        brands = brands[brands != ""]
+        for brand, count in brands.str.upper().value_counts().items():
+            entries.append((brand, KIND_BRAND, int(count)))
+
+    if "Nama Produk" in products.columns:
+        names = products["Nama Produk"].dropna().astype(str).str.strip()
+        names = names[names != ""]
+        for name, count in names.value_counts().items():
+            entries.append((name, KIND_PRODUCT, int(count)))
+
+    for canonical, synonyms in (ingredients or {}).items():
+        ids = set()
+        for syn in [canonical, *synonyms]:
+            found = search_index.lookup(syn, ["Kandungan Utama"])
+            if found is not None:
+                ids.update(found.tolist())
+        if ids:
+            entries.append((canonical, KIND_INGREDIENT, len(ids)))
+
+    return SuggestIndex(entries)
@@ -0,0 +1,57 @@
+# =====================================================
+# NORMALISASI TEKS KATALOG (DIHITUNG SEKALI SAAT LOAD)
+# =====================================================
+import re
+import unicodedata
+
+import pandas as pd
+
+
+def clean_text(s: str) -> str:
+    if not isinstance(s, str): return ""
+    s = s.lower()
+    s = unicodedata.normalize("NFKD", s)
+    s = re.sub(r"[^a-z0-9\s]", " ", s)
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def tokenize(s: str) -> set:
+    return set(clean_text(s).split())
+
+
+def normalize_dataset_text(val):
+    return str(val).lower().replace("-", " ").replace("_", " ")
+
+
+# kolom sumber → (kolom teks bersih, kolom token set) untuk web / recommend()
+NORM_COLUMNS = {
+    "Jenis Kulit": ("__jenis_norm", "__jenis_tokens"),
+    "Kandungan Utama": ("__kandungan_norm", "__kandungan_tokens"),
+    "Masalah Kulit": ("__m_norm", "__m_tokens"),
+}
+
+# kolom sumber → kolom teks versi chatbot (normalize_dataset_text)
+CHAT_TEXT_COLUMNS = {
+    "Jenis Kulit": "__jenis_text",
+    "Masalah Kulit": "__masalah_text",
+    "Brand": "__brand_text",
+    "Kandungan Utama": "__kandungan_text",
+}
+
+
+def add_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Tambahkan kolom teks ter-normalisasi + token set supaya hot path cukup membaca."""
+    df = df.copy()
+    for col, (norm_col, tok_col) in NORM_COLUMNS.items():
+        src = df[col] if col in df.columns else pd.Series("", index=df.index)
+        norm = src.astype(str).map(clean_text)
+        df[norm_col] = norm.astype(object)
+        # token set yang sama cukup disimpan sekali (produk berulang per jenis kulit)
+        interned = {}
+        df[tok_col] = norm.map(lambda s: interned.setdefault(s, frozenset(s.split()))).astype(object)
+
+    for col, text_col in CHAT_TEXT_COLUMNS.items():
+        src = df[col] if col in df.columns else pd.Series("", index=df.index)
+        df[text_col] = src.fillna("").map(normalize_dataset_text).astype(object)
+
+    return df
@@ -17,6 +17,7 @@ from mapping.ingredient_rules.ingredient_interactions import INGREDIENT_INTERACT
 from mapping.ingredient_rules.kandungan_dalam_produk import KANDUNGAN_DALAM_PRODUK
 from mapping.ingredient_rules.ingredient_suggestion import INGREDIENT_SUGGESTION
 from mapping.product.product_benefit_mapping import PRODUCT_BENEFIT_RULES, CATEGORY_BASE_BENEFITS
+from catalog.text import normalize_dataset_text, CHAT_TEXT_COLUMNS
 
 # =========================
 # KONFIGURASI
@@ -87,8 +88,12 @@ def map_problem_display(raw_text):
         detected_displays.append("masalah pori-pori") 
     return detected_displays
 
-def normalize_dataset_text(val):
-    return str(val).lower().replace("-", " ").replace("_", " ")
+def dataset_field_text(p: dict, col: str) -> str:
+    """Pakai teks ter-normalisasi dari catalog (kalau ada), fallback hitung langsung."""
+    text_col = CHAT_TEXT_COLUMNS.get(col)
+    if text_col and text_col in p:
+        return p[text_col]
+    return normalize_dataset_text(p.get(col, ""))
 
 def is_gibberish(text):
     text = clean_text(text).lower()
@@ -711,15 +716,10 @@ def get_recommendation_response(state: dict):
     filtered = []
 
     for p in products:
-        product_skin = normalize_dataset_text(p.get("Jenis Kulit", ""))
-        product_problem = normalize_dataset_text(p.get("Masalah Kulit", ""))
-        product_brand = normalize_dataset_text(p.get("Brand", ""))
-        product_ing = normalize_dataset_text(p.get("Kandungan Utama", ""))
-
-        p_benefits_list = get_product_benefits(p)
-        p_benefits_string = " ".join(p_benefits_list).lower()
-
-        product_info_full = (product_problem + " " + " ".join(p_benefits_list) + " " + product_ing).lower()
+        product_skin = dataset_field_text(p, "Jenis Kulit")
+        product_problem = dataset_field_text(p, "Masalah Kulit")
+        product_brand = dataset_field_text(p, "Brand")
+        product_ing = dataset_field_text(p, "Kandungan Utama")
 
         if user_ings:
             if not any(ing.lower() in product_ing for ing in user_ings):
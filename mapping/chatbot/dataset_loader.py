@@ -1,13 +1,10 @@
-import pandas as pd
+from catalog import load_catalog
 
-def load_chatbot_dataset():
-    def load(file):
-        return pd.read_excel(file).fillna("").to_dict(orient="records")
-
-    return {
-        "facialwash": load("dataset/Chatbot/FACIAL WASH ALL BRAND.xlsx"),
-        "toner": load("dataset/Chatbot/TONER ALL BRAND.xlsx"),
-        "serum": load("dataset/Chatbot/SERUM ALL BRAND.xlsx"),
-        "moisturizer": load("dataset/Chatbot/MOISTURIZER ALL BRAND.xlsx"),
-        "sunscreen": load("dataset/Chatbot/SUNSCREEN ALL BRAND.xlsx"),
-    }
+def load_chatbot_dataset(catalog=None):
+    """
+    Dataset chatbot = record view dari catalog produk yang sama dengan web.
+    Kalau catalog belum ada (dipakai standalone), load dari folder dataset.
+    """
+    if catalog is None:
+        catalog = load_catalog("dataset", partial=True)
+    return catalog.records_view()
@@ -44,7 +44,7 @@ document.addEventListener("DOMContentLoaded", function () {
 
 
             card.innerHTML = `
-                <img src="${imgSrc}" alt="${p.nama}" class="produk-img">
+                <img src="${imgSrc}" ${p.image_srcset ? `srcset="${p.image_srcset}" sizes="(min-width: 768px) 25vw, 100vw"` : ""} alt="${p.nama}" class="produk-img">
                 <h3>${p.nama}</h3>
                 <p><strong>Brand:</strong> ${p.brand}</p>
                 <p><strong>Kategori:</strong> ${p.kategori}</p>
@@ -97,7 +97,7 @@ document.addEventListener("DOMContentLoaded", function () {
         /* ===============================
         3) Fetch ke Backend
         =============================== */
-        fetch(`/api/produk?q=${encodeURIComponent(q)}&category=${encodeURIComponent(category)}&brand=${encodeURIComponent(brand)}&alcohol_free=${alcoholFree}&fragrance_free=${fragranceFree}&non_comedogenic=${nonComedogenic}`)
+        fetch(`/api/produk?q=${encodeURIComponent(q)}&category=${encodeURIComponent(category)}&brand=${encodeURIComponent(brand)}&alcohol_free=${alcoholFree}&fragrance_free=${fragranceFree}&non_comedogenic=${nonComedogenic}${initialLimit ? `&limit=${initialLimit}` : ""}`)
             .then(res => res.json())
             .then(data => {
                 if (loaderProduk) loaderProduk.style.display = "none";
@@ -220,7 +220,7 @@ document.addEventListener("DOMContentLoaded", function () {
 
                             div.innerHTML = `
                                 <div class="card-content">
-                                    <img src="${imgSrc}" alt="${item.nama}" class="produk-img">
+                                    <img src="${imgSrc}" ${item.image_srcset ? `srcset="${item.image_srcset}" sizes="(min-width: 768px) 25vw, 100vw"` : ""} alt="${item.nama}" class="produk-img">
                                     <h3>${item.nama}</h3>
                                     <div class="card-details">
                                         <p class="detail-row"><strong>Brand:</strong> ${item.brand}</p>
@@ -352,3 +352,41 @@ document.addEventListener("DOMContentLoaded", () => {
   }
 });
 
+
+/* ================================
+   AUTOCOMPLETE KOTAK PENCARIAN
+================================ */
+document.addEventListener("DOMContentLoaded", () => {
+  const input = document.getElementById("searchText");
+  if (!input) return;
+
+  const list = document.createElement("datalist");
+  list.id = "searchSuggest";
+  input.after(list);
+  input.setAttribute("list", list.id);
+  input.setAttribute("autocomplete", "off");
+
+  let timer = null;
+  input.addEventListener("input", () => {
+    clearTimeout(timer);
+    const prefix = input.value.trim();
+    if (!prefix) {
+      list.innerHTML = "";
+      return;
+    }
+    timer = setTimeout(async () => {
+      try {
+        const res = await fetch(`/api/suggest?prefix=${encodeURIComponent(prefix)}`);
+        const data = await res.json();
+        list.innerHTML = "";
+        (data.suggestions || []).forEach(s => {
+          const opt = document.createElement("option");
+          opt.value = s.label;
+          list.appendChild(opt);
+        });
+      } catch (err) {
+        console.error("Gagal memuat saran pencarian:", err);
+      }
+    }, 120);
+  });
+});
@@ -0,0 +1,146 @@
+# =====================================================
+# WEB PACKAGE INIT (HELPER HTTP UNTUK ROUTES FLASK)
+# =====================================================
+
+# ========================
+# Pagination (Keyset / Cursor)
+# ========================
+from web.pagination import (
+    encode_cursor,
+    decode_cursor,
+    keyset_page,
+    InvalidCursor
+)
+
+# ========================
+# Response Cache (LRU + TTL)
+# ========================
+from web.cache import (
+    ResponseCache,
+    cached_response,
+    canonical_args
+)
+
+# ========================
+# ETag / Conditional GET
+# ========================
+from web.conditional import (
+    conditional_get,
+    catalog_etag,
+    REVALIDATE,
+    SHORT_LIVED
+)
+
+# ========================
+# JSON Provider & Kompresi Response
+# ========================
+from web.jsonprovider import (
+    OrjsonProvider,
+    make_json_provider,
+    json_provider_name
+)
+from web.compression import (
+    compress_response,
+    choose_encoding,
+    compress_body
+)
+
+# ========================
+# Export Streaming (NDJSON / CSV)
+# ========================
+from web.export import (
+    EXPORT_FORMATS,
+    EXPORT_CHUNK_SIZE,
+    iter_chunks,
+    ndjson_stream,
+    csv_stream
+)
+
+# ========================
+# Manifest Gambar Produk
+# ========================
+from web.images import (
+    ImageManifest,
+    ImageManifestStore,
+    normalize_image_path,
+    DEFAULT_IMAGE
+)
+
+# ========================
+# Static Asset Ber-hash (Immutable + Pre-kompresi)
+# ========================
+from web.assets import (
+    AssetManifest,
+    StaticAssets,
+    init_static_assets,
+    precompress_static,
+    IMMUTABLE
+)
+
+# ========================
+# Thumbnail Gambar Produk (srcset)
+# ========================
+from web.thumbnails import (
+    THUMB_WIDTHS,
+    PILLOW_MISSING,
+    generate_thumbnails,
+    plan_thumbnails
+)
+
+# =====================================================
+# Exported symbols (PUBLIC API)
+# =====================================================
+__all__ = [
+    # pagination
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_page",
+    "InvalidCursor",
+
+    # cache
+    "ResponseCache",
+    "cached_response",
+    "canonical_args",
+
+    # conditional GET
+    "conditional_get",
+    "catalog_etag",
+    "REVALIDATE",
+    "SHORT_LIVED",
+
+    # json provider
+    "OrjsonProvider",
+    "make_json_provider",
+    "json_provider_name",
+
+    # compression
+    "compress_response",
+    "choose_encoding",
+    "compress_body",
+
+    # export
+    "EXPORT_FORMATS",
+    "EXPORT_CHUNK_SIZE",
+    "iter_chunks",
+    "ndjson_stream",
+    "csv_stream",
+
+    # images
+    "ImageManifest",
+    "ImageManifestStore",
+    "normalize_image_path",
+    "DEFAULT_IMAGE",
+
+    # static assets
+    "AssetManifest",
+    "StaticAssets",
+    "init_static_assets",
+    "precompress_static",
+    "IMMUTABLE",
+
+    # thumbnails
+    "THUMB_WIDTHS",
+    "PILLOW_MISSING",
+    "generate_thumbnails",
+    "plan_thumbnails"
+]
@@ -0,0 +1,199 @@
+# =====================================================
+# STATIC ASSET: URL BER-HASH + CACHE IMMUTABLE + PRE-KOMPRESI
+# =====================================================
+# Saat startup semua file di folder static di-hash (sha1 isi file), lalu
+# url_for('static', filename='css/style.css') otomatis jadi
+# /static/css/style.<hash>.css. URL ber-hash isinya tidak akan pernah
+# berubah → dikirim dengan Cache-Control immutable (browser tidak revalidate).
+# Kalau ada sibling .br / .gz (dibuat lewat `flask --app app precompress-static`)
+# dan client mendukung, sibling itu yang dikirim.
+# URL tanpa hash tetap jalan seperti biasa (caching default Flask).
+# Gambar bisa berubah saat runtime (manifest gambar / thumbnail baru): manifest
+# asset dibangun ulang kalau versi gambar berubah, dan tiap file yang dikirim
+# dicek ukuran+mtime-nya — kalau isinya sudah beda dari hash di URL, di-hash
+# ulang lalu client di-redirect ke URL baru (URL lama tidak disajikan immutable).
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+
+from flask import redirect, request, send_from_directory, url_for
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HASH_LENGTH = 10
+IMMUTABLE = "public, max-age=31536000, immutable"
+IMMUTABLE_MAX_AGE = 31536000
+
+# sibling pre-kompresi: urutan = prioritas
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+# gambar png/jpg sudah terkompres, yang layak cuma teks
+PRECOMPRESS_EXTS = {".css", ".js", ".json", ".svg", ".html", ".txt"}
+PRECOMPRESS_MIN_SIZE = 1024
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(rel: str, digest: str) -> str:
+    stem, ext = os.path.splitext(rel)
+    return f"{stem}.{digest}{ext}"
+
+
+def _walk_files(static_dir: str):
+    for root, dirnames, files in os.walk(static_dir):
+        dirnames.sort()
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            yield os.path.relpath(full, static_dir).replace(os.sep, "/"), full
+
+
+class AssetManifest:
+    def __init__(self, static_dir: str):
+        self.static_dir = str(static_dir)
+        self.hashed = {}      # path asli → path ber-hash
+        self.originals = {}   # path ber-hash → path asli
+        self.compressed = {}  # path asli → {encoding: path sibling}
+        self.stats = {}       # path asli → (ukuran, mtime_ns) saat di-hash
+        self._lock = threading.Lock()
+
+        files = dict(_walk_files(self.static_dir))
+        for rel, full in files.items():
+            sibling_of = next((rel[:-len(suffix)] for _, suffix in PRECOMPRESSED if rel.endswith(suffix)), None)
+            if sibling_of in files:
+                continue
+            self._hash_file(rel, full)
+            variants = {
+                encoding: rel + suffix
+                for encoding, suffix in PRECOMPRESSED
+                if rel + suffix in files and os.path.getmtime(files[rel + suffix]) >= os.path.getmtime(full)
+            }
+            if variants:
+                self.compressed[rel] = variants
+
+    def __len__(self):
+        return len(self.hashed)
+
+    def _hash_file(self, rel: str, full: str):
+        st = os.stat(full)
+        self.stats[rel] = (st.st_size, st.st_mtime_ns)
+        self.hashed[rel] = hashed_name(rel, file_digest(full))
+        self.originals[self.hashed[rel]] = rel
+
+    def _refresh(self, rel: str) -> bool:
+        """Hash ulang `rel` kalau file berubah sejak di-hash. Return False kalau file hilang."""
+        full = os.path.join(self.static_dir, rel)
+        try:
+            st = os.stat(full)
+        except OSError:
+            return False
+        if (st.st_size, st.st_mtime_ns) != self.stats.get(rel):
+            with self._lock:
+                self._hash_file(rel, full)
+        return True
+
+    def url_defaults(self, endpoint, values):
+        """Callback app.url_defaults: filename static → versi ber-hash."""
+        if endpoint == "static":
+            filename = values.get("filename")
+            if filename in self.hashed:
+                values["filename"] = self.hashed[filename]
+
+    def send(self, app, filename: str):
+        """View /static/<filename>: path ber-hash → immutable (+ sibling .br/.gz)."""
+        original = self.originals.get(filename)
+        if original is None:
+            return app.send_static_file(filename)
+        if not self._refresh(original):
+            return app.send_static_file(original)
+        if self.hashed[original] != filename:
+            # isi file sudah berubah → hash di URL basi, arahkan ke URL yang benar
+            response = redirect(url_for("static", filename=original))
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        path, encoding = original, None
+        variants = self.compressed.get(original, {})
+        for enc, _ in PRECOMPRESSED:
+            if enc in variants and request.accept_encodings.quality(enc) > 0:
+                path, encoding = variants[enc], enc
+                break
+
+        mimetype = mimetypes.guess_type(original)[0] or "application/octet-stream"
+        response = send_from_directory(self.static_dir, path, mimetype=mimetype, max_age=IMMUTABLE_MAX_AGE)
+        response.headers["Cache-Control"] = IMMUTABLE
+        if variants:
+            response.vary.add("Accept-Encoding")
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        return response
+
+
+class StaticAssets:
+    """Pemegang manifest aktif; dibangun ulang kalau version_fn() (mis. versi manifest gambar) berubah."""
+
+    def __init__(self, app, version_fn=None):
+        self.app = app
+        self.version_fn = version_fn or (lambda: None)
+        self._version = None
+        self._manifest = None
+        self._lock = threading.Lock()
+
+    def current(self) -> AssetManifest:
+        version = self.version_fn()
+        manifest = self._manifest
+        if manifest is not None and version == self._version:
+            return manifest
+        with self._lock:
+            if self._manifest is None or version != self._version:
+                self._manifest = AssetManifest(self.app.static_folder)
+                self._version = version
+                print(f"[ASSETS] {len(self._manifest)} file static ber-hash, "
+                      f"{len(self._manifest.compressed)} punya versi terkompres")
+            return self._manifest
+
+    def url_defaults(self, endpoint, values):
+        if endpoint == "static":
+            self.current().url_defaults(endpoint, values)
+
+    def send(self, filename: str):
+        return self.current().send(self.app, filename)
+
+
+def init_static_assets(app, version_fn=None) -> StaticAssets:
+    """Pasang URL ber-hash + view static immutable ke app Flask."""
+    assets = StaticAssets(app, version_fn)
+    assets.current()
+    app.url_defaults(assets.url_defaults)
+    app.view_functions["static"] = assets.send
+    return assets
+
+
+def precompress_static(static_dir: str) -> list:
+    """Tulis sibling .gz (dan .br kalau modul brotli ada) untuk file teks static."""
+    written = []
+    for rel, full in _walk_files(str(static_dir)):
+        if os.path.splitext(rel)[1].lower() not in PRECOMPRESS_EXTS or os.path.getsize(full) < PRECOMPRESS_MIN_SIZE:
+            continue
+        with open(full, "rb") as f:
+            data = f.read()
+        for encoding, suffix in PRECOMPRESSED:
+            if encoding == "br" and brotli is None:
+                continue
+            target = full + suffix
+            if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(full):
+                continue
+            packed = brotli.compress(data, quality=11) if encoding == "br" else gzip.compress(data, compresslevel=9, mtime=0)
+            with open(target, "wb") as f:
+                f.write(packed)
+            written.append((rel + suffix, len(data), len(packed)))
+    return written
@@ -0,0 +1,108 @@
+# =====================================================
+# RESPONSE CACHE (LRU + TTL) PER VERSI CATALOG
+# =====================================================
+# Halaman katalog & API produk murni fungsi dari query string + isi catalog,
+# jadi body response-nya bisa dipakai ulang. Key = endpoint + path + query
+# (dikanonikkan) + versi catalog → saat catalog di-reload, key lama otomatis
+# tidak kepakai lagi dan tergusur LRU.
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, make_response, request
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 300.0
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def canonical_args(args) -> tuple:
+    """Query args → tuple stabil (urutan key diabaikan, urutan nilai list dipertahankan)."""
+    return tuple((key, tuple(args.getlist(key))) for key in sorted(args.keys()))
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int = None, ttl: float = None):
+        self.maxsize = _env_number("SKINALYZE_RESPONSE_CACHE_SIZE", DEFAULT_CACHE_SIZE, int) if maxsize is None else maxsize
+        self.ttl = _env_number("SKINALYZE_RESPONSE_CACHE_TTL", DEFAULT_CACHE_TTL, float) if ttl is None else ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires = entry
+                if self.ttl <= 0 or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+def cached_response(cache: ResponseCache, version_fn):
+    """
+    Decorator view Flask: simpan body response 200 (HTML / JSON) per
+    (endpoint, path, query, versi catalog). Yang disimpan cuma bytes +
+    status + content type, Response baru dibuat tiap hit supaya
+    after_request (cookie dsb) tetap jalan normal.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not cache.enabled:
+                return view(*args, **kwargs)
+
+            key = (request.endpoint, request.path, canonical_args(request.args), version_fn())
+            hit = cache.get(key)
+            if hit is not None:
+                body, status, content_type = hit
+                return Response(body, status=status, content_type=content_type)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.direct_passthrough:
+                cache.set(key, (response.get_data(), response.status_code, response.content_type))
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,81 @@
+# =====================================================
+# KOMPRESI RESPONSE (GZIP / BROTLI) VIA ACCEPT-ENCODING
+# =====================================================
+# Payload produk mengulang string kandungan & teks manfaat yang panjang,
+# jadi rasio kompresinya tinggi. Dipasang sebagai after_request: body JSON /
+# HTML di atas ambang ukuran dikompres sesuai Accept-Encoding client.
+# brotli opsional (pip install brotli); tanpa itu cukup gzip dari stdlib.
+# File statis & response streaming (direct_passthrough) tidak disentuh.
+import gzip
+import os
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "text/html",
+    "text/css",
+    "text/javascript",
+    "text/plain",
+    "text/csv",
+    "application/x-ndjson",
+}
+
+
+def _min_size() -> int:
+    try:
+        return int(os.getenv("SKINALYZE_COMPRESS_MIN_SIZE", "").strip() or DEFAULT_MIN_SIZE)
+    except ValueError:
+        return DEFAULT_MIN_SIZE
+
+
+def choose_encoding(accept_encodings) -> str:
+    """'br' / 'gzip' / None dari header Accept-Encoding (quality 0 = ditolak)."""
+    if brotli is not None and accept_encodings.quality("br") > 0:
+        return "br"
+    if accept_encodings.quality("gzip") > 0:
+        return "gzip"
+    return None
+
+
+def compress_body(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    # mtime=0 → output deterministik (body sama = bytes sama)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response):
+    """Hook after_request: kompres body kalau layak & client mendukung."""
+    if (
+        response.direct_passthrough
+        or response.mimetype not in COMPRESSIBLE_TYPES
+        or not 200 <= response.status_code < 300
+        or response.status_code == 204
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None or response.content_length is None or response.content_length < _min_size():
+        return response
+
+    response.set_data(compress_body(response.get_data(), encoding))
+    response.headers["Content-Encoding"] = encoding
+
+    # representasi terkompres ≠ byte-identik → ETag jadi weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -0,0 +1,42 @@
+# =====================================================
+# ETAG + CONDITIONAL GET (304) UNTUK API KATALOG
+# =====================================================
+# ETag dihitung dari versi catalog + endpoint + query kanonik, jadi bisa
+# dicek SEBELUM view jalan: kalau cocok langsung 304 tanpa filter/serialisasi.
+import hashlib
+from functools import wraps
+
+from flask import make_response, request
+
+from web.cache import canonical_args
+
+# Client wajib revalidate tiap kali (murah karena 304), catalog bisa hot-reload kapan saja.
+# private: response app selalu ikut membawa Set-Cookie (session / chat_uid) per user,
+# jadi tidak boleh disimpan proxy/CDN bersama lalu diputar ulang ke user lain.
+REVALIDATE = "private, no-cache"
+# Data yang jarang berubah (daftar brand, autocomplete): boleh dipakai 60 detik tanpa revalidate
+SHORT_LIVED = "private, max-age=60, must-revalidate"
+
+
+def catalog_etag(version: str) -> str:
+    raw = repr((version, request.endpoint, canonical_args(request.args)))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def conditional_get(version_fn, cache_control: str = REVALIDATE):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = catalog_etag(version_fn())
+            # weak compare: ETag bisa jadi W/"..." setelah body dikompres
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = cache_control
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,47 @@
+# =====================================================
+# EXPORT STREAMING (NDJSON / CSV) PER CHUNK
+# =====================================================
+# Dump catalog penuh tidak dirakit jadi satu payload besar: record dibuat &
+# diserialisasi per chunk berukuran tetap lalu langsung di-yield ke response
+# generator Flask. Memori per request ≈ ukuran satu chunk, berapapun jumlah produk.
+import csv
+import io
+
+EXPORT_CHUNK_SIZE = 500
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def iter_chunks(seq, size: int = EXPORT_CHUNK_SIZE):
+    for start in range(0, len(seq), size):
+        yield seq[start:start + size]
+
+
+def ndjson_stream(chunks, dumps):
+    """chunks: iterable list-of-dict → bytes NDJSON (1 objek per baris) per chunk."""
+    for records in chunks:
+        yield "".join(dumps(record) + "\n" for record in records).encode("utf-8")
+
+
+def _csv_value(value):
+    # list (manfaat/catatan) → satu sel dipisah "; "
+    if isinstance(value, (list, tuple)):
+        return "; ".join(str(v) for v in value)
+    return value
+
+
+def csv_stream(chunks, fields: list):
+    """chunks: iterable list-of-dict → bytes CSV (header di chunk pertama)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for records in chunks:
+        writer.writerows([_csv_value(record.get(f, "")) for f in fields] for record in records)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
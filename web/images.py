@@ -0,0 +1,140 @@
+# =====================================================
+# MANIFEST GAMBAR PRODUK (SCAN static/images SEKALI)
+# =====================================================
+# Dulu tiap card produk bisa memanggil Path.exists() sampai 6x (kolom gambar
+# + tebakan ekstensi). Sekarang folder static/images di-scan sekali jadi
+# manifest: path relatif (lowercase) → path asli, dan key kategori/nama →
+# path. Resolve cukup lookup dict, termasuk path Windows / beda huruf besar
+# kecil dari dataset ("C:\project\static\Images\serum\X.png").
+# Manifest dibangun ulang kalau mtime folder berubah (dicek paling sering
+# tiap RECHECK_INTERVAL detik, cuma stat folder, bukan tiap file).
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+from web.thumbnails import THUMB_WIDTHS, thumbnail_rel
+
+IMAGE_PREFIX = "images"
+DEFAULT_IMAGE = "images/default.png"
+# urutan prioritas kalau ada beberapa file dengan nama sama (sama seperti dulu)
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+RECHECK_INTERVAL = 10.0
+
+
+def normalize_image_path(value) -> str:
+    """Nilai kolom gambar dataset → path relatif terhadap static/images (lowercase, '/')."""
+    if value is None:
+        return ""
+    path = str(value).strip().replace("\\", "/")
+    if not path or path.lower() == "nan":
+        return ""
+    lower = path.lower()
+    # path absolut / Windows: ambil bagian setelah ".../images/" terakhir
+    marker = lower.rfind(f"/{IMAGE_PREFIX}/")
+    if marker >= 0:
+        lower = lower[marker + len(IMAGE_PREFIX) + 2:]
+    elif lower.startswith(f"{IMAGE_PREFIX}/"):
+        lower = lower[len(IMAGE_PREFIX) + 1:]
+    return lower.lstrip("./")
+
+
+def product_image_key(kategori: str, nama_produk: str) -> str:
+    """Key tebakan lama: <kategori tanpa spasi>/<nama_produk_pakai_underscore> (lowercase)."""
+    kat = str(kategori).lower().replace(" ", "")
+    prod = str(nama_produk).strip().replace(" ", "_").lower()
+    return f"{kat}/{prod}"
+
+
+class ImageManifest:
+    def __init__(self, images_dir: Path):
+        self.images_dir = Path(images_dir)
+        self.paths = {}    # path relatif lowercase → "images/<path asli>"
+        self.stems = {}    # path relatif tanpa ekstensi (lowercase) → "images/<path asli>"
+        self.dirs = []     # folder yang di-scan (untuk cek perubahan)
+        ranked = []
+
+        for root, dirnames, files in os.walk(self.images_dir):
+            dirnames.sort()
+            self.dirs.append(root)
+            rel_root = Path(root).relative_to(self.images_dir).as_posix()
+            for name in sorted(files):
+                rel = name if rel_root == "." else f"{rel_root}/{name}"
+                url = f"{IMAGE_PREFIX}/{rel}"
+                self.paths[rel.lower()] = url
+                stem, ext = os.path.splitext(rel.lower())
+                if ext in IMAGE_EXTS:
+                    ranked.append((stem, IMAGE_EXTS.index(ext), url))
+
+        for stem, _, url in sorted(ranked, reverse=True):
+            self.stems[stem] = url
+
+        self.signature = self._dir_signature()
+        self.version = hashlib.sha1(repr(sorted(self.paths.values())).encode("utf-8")).hexdigest()[:12]
+
+    def _dir_signature(self) -> tuple:
+        sig = []
+        for d in self.dirs:
+            try:
+                sig.append((d, os.stat(d).st_mtime_ns))
+            except OSError:
+                sig.append((d, None))
+        return tuple(sig)
+
+    def changed(self) -> bool:
+        return self._dir_signature() != self.signature
+
+    def __len__(self):
+        return len(self.paths)
+
+    def resolve(self, kategori: str = "", nama_produk: str = "", image_col: str = "") -> str:
+        """Path gambar relatif ke folder static (tanpa menyentuh filesystem)."""
+        # 1. Dari kolom gambar dataset
+        path = normalize_image_path(image_col)
+        if path and path in self.paths:
+            return self.paths[path]
+
+        # 2. Tebakan berdasarkan kategori/nama_produk (ekstensi apa saja, case-insensitive)
+        if kategori and nama_produk:
+            found = self.stems.get(product_image_key(kategori, nama_produk))
+            if found:
+                return found
+
+        return DEFAULT_IMAGE
+
+    def srcset(self, image: str) -> list:
+        """[(path thumbnail, lebar)] yang sudah tersedia untuk gambar hasil resolve()."""
+        rel = image[len(IMAGE_PREFIX) + 1:] if image.startswith(f"{IMAGE_PREFIX}/") else image
+        found = []
+        for width in THUMB_WIDTHS:
+            for fmt in ("webp", "jpg"):
+                thumb = self.paths.get(thumbnail_rel(rel, width, fmt).lower())
+                if thumb:
+                    found.append((thumb, width))
+                    break
+        return found
+
+
+class ImageManifestStore:
+    """Pemegang manifest aktif; scan ulang hanya kalau folder gambar berubah."""
+
+    def __init__(self, images_dir: Path, recheck_interval: float = RECHECK_INTERVAL):
+        self.images_dir = Path(images_dir)
+        self.recheck_interval = recheck_interval
+        self._current = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> ImageManifest:
+        manifest = self._current
+        now = time.monotonic()
+        if manifest is not None and now - self._checked < self.recheck_interval:
+            return manifest
+        with self._lock:
+            manifest = self._current
+            if manifest is None or manifest.changed():
+                manifest = self._current = ImageManifest(self.images_dir)
+                print(f"[IMAGES] Manifest: {len(manifest)} file (versi {manifest.version})")
+            self._checked = now
+            return manifest
@@ -0,0 +1,56 @@
+# =====================================================
+# JSON PROVIDER FLASK (ORJSON KALAU ADA, FALLBACK STDLIB)
+# =====================================================
+# orjson opsional: kalau terpasang, jsonify() pakai orjson (langsung ke bytes,
+# jauh lebih cepat untuk list produk yang besar). Kalau tidak ada → provider
+# bawaan Flask, perilaku sama persis seperti sebelumnya.
+# Paksa stdlib lewat env: SKINALYZE_JSON_PROVIDER=stdlib
+import os
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Sama seperti DefaultJSONProvider (sort_keys, compact), encoder-nya orjson."""
+
+    option = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+    def _encode(self, obj) -> bytes:
+        return orjson.dumps(obj, default=self.default, option=self.option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        # argumen khusus (indent, dll) → serahkan ke stdlib
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # mode debug (pretty print) tetap lewat stdlib
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj) + b"\n", mimetype=self.mimetype)
+
+
+def json_provider_name() -> str:
+    wanted = os.getenv("SKINALYZE_JSON_PROVIDER", "").strip().lower()
+    if orjson is not None and wanted != "stdlib":
+        return "orjson"
+    return "stdlib"
+
+
+def make_json_provider(app):
+    """Provider untuk app.json sesuai ketersediaan orjson + env."""
+    if json_provider_name() == "orjson":
+        return OrjsonProvider(app)
+    return DefaultJSONProvider(app)
@@ -0,0 +1,84 @@
+# =====================================================
+# KEYSET PAGINATION + CURSOR OPAQUE UNTUK API PRODUK
+# =====================================================
+# Urutan stabil = product_id (urutan tabel produk di catalog).
+# Cursor menyimpan product_id terakhir + versi catalog + key natural produk,
+# jadi kalau catalog di-reload di tengah paging, posisi dicari ulang lewat key.
+import base64
+import json
+
+import numpy as np
+import pandas as pd
+
+from catalog.schema import PRODUCT_KEY
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(catalog, product_id: int) -> str:
+    row = catalog.products.loc[product_id]
+    payload = {
+        "v": catalog.version,
+        "id": int(product_id),
+        "k": [str(row.get(col, "")) for col in PRODUCT_KEY],
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, catalog):
+    """Cursor → product_id terakhir yang sudah dikirim (None = mulai dari awal)."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        product_id = int(payload["id"])
+        key = list(payload["k"])
+    except Exception:
+        raise InvalidCursor("cursor tidak valid")
+
+    if payload.get("v") == catalog.version:
+        return product_id
+
+    # versi catalog sudah berganti → cari produk yang sama lewat key natural
+    products = catalog.products
+    mask = np.ones(len(products), dtype=bool)
+    for col, val in zip(PRODUCT_KEY, key):
+        if col in products.columns:
+            mask &= (products[col].astype(str) == val).to_numpy()
+    hits = products.index[mask]
+    if not len(hits):
+        raise InvalidCursor("produk pada cursor sudah tidak ada di catalog")
+    return int(hits[0])
+
+
+def keyset_page(frame: pd.DataFrame, ids: np.ndarray, after, limit: int, keep=None):
+    """
+    Ambil satu halaman dari `ids` (product_id terurut) setelah `after`.
+    Baris DataFrame hanya dimaterialisasi per chunk sampai halaman penuh;
+    keep(chunk) dipakai untuk filter yang harus cek baris (mis. substring q).
+    Return: (DataFrame halaman, product_id terakhir kalau masih ada halaman berikutnya)
+    """
+    ids = np.asarray(ids)
+    if after is not None:
+        ids = ids[ids > after]
+
+    chunks, taken, pos = [], 0, 0
+    step = limit + 1
+    while pos < len(ids) and taken <= limit:
+        chunk = frame.loc[ids[pos:pos + step]]
+        if keep is not None:
+            chunk = keep(chunk)
+        chunks.append(chunk)
+        taken += len(chunk)
+        pos += step
+
+    if not chunks:
+        return frame.iloc[0:0], None
+    rows = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+    page = rows.iloc[:limit]
+    last_id = page.index[-1] if taken > limit and len(page) else None
+    return page, last_id
@@ -0,0 +1,122 @@
+# =====================================================
+# THUMBNAIL GAMBAR PRODUK (SRCSET 160 / 320 / 640)
+# =====================================================
+# Gambar produk asli (800px+) dipakai di card kecil. Di sini dibuat versi
+# lebar tetap ke static/images/_thumbs/<lebar>/<path asli>.<webp|jpg>,
+# lalu card mengirim srcset supaya browser ambil ukuran yang pas.
+# - Offline: `flask --app app thumbnails` (paralel per core, ProcessPool)
+# - Incremental: thumbnail yang lebih baru dari sumbernya dilewati,
+#   thumbnail yang sumbernya sudah hilang dihapus.
+# Pillow opsional (pip install pillow). Tanpa Pillow tidak ada thumbnail
+# yang dibuat dan card tetap pakai gambar asli (srcset kosong).
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+THUMB_DIR = "_thumbs"
+THUMB_WIDTHS = (160, 320, 640)
+THUMB_QUALITY = 80
+SOURCE_EXTS = {".png", ".jpg", ".jpeg", ".webp"}
+PILLOW_MISSING = "Pillow belum terpasang (pip install pillow)."
+
+
+def thumbnail_format() -> str:
+    """webp kalau Pillow mendukung, selain itu jpg (bisa dipaksa lewat SKINALYZE_THUMB_FORMAT)."""
+    wanted = os.getenv("SKINALYZE_THUMB_FORMAT", "").strip().lower()
+    if wanted in ("webp", "jpg"):
+        return wanted
+    if Image is not None and features.check("webp"):
+        return "webp"
+    return "jpg"
+
+
+def thumbnail_rel(rel: str, width: int, fmt: str) -> str:
+    """Path thumbnail relatif ke static/images untuk gambar `rel`."""
+    # ekstensi asli tetap ikut (foo.png → foo.png.webp) supaya foo.jpg & foo.png tidak bentrok
+    return f"{THUMB_DIR}/{width}/{rel}.{fmt}"
+
+
+def _source_images(images_dir: Path):
+    for root, dirnames, files in os.walk(images_dir):
+        dirnames[:] = sorted(d for d in dirnames if d != THUMB_DIR)
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in SOURCE_EXTS:
+                full = Path(root) / name
+                yield full.relative_to(images_dir).as_posix(), full
+
+
+def plan_thumbnails(images_dir: Path, widths=THUMB_WIDTHS, fmt: str = None) -> tuple:
+    """(jobs, stale): jobs = [(src, dst, lebar)] yang perlu dibuat, stale = thumbnail yatim."""
+    images_dir = Path(images_dir)
+    fmt = fmt or thumbnail_format()
+    jobs, expected = [], set()
+    for rel, src in _source_images(images_dir):
+        for width in widths:
+            dst = images_dir / thumbnail_rel(rel, width, fmt)
+            expected.add(dst)
+            if not dst.exists() or dst.stat().st_mtime < src.stat().st_mtime:
+                jobs.append((str(src), str(dst), width))
+
+    thumb_root = images_dir / THUMB_DIR
+    stale = [p for p in thumb_root.rglob("*") if p.is_file() and p not in expected] if thumb_root.exists() else []
+    return jobs, stale
+
+
+def render_thumbnail(job) -> tuple:
+    """Worker: resize 1 gambar ke lebar target (tidak di-upscale). Return (dst, ukuran byte)."""
+    src, dst, width = job
+    with Image.open(src) as img:
+        img.load()
+        if img.width > width:
+            img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+        if dst.endswith(".jpg"):
+            # jpg tidak punya alpha → tempel di atas latar putih
+            if img.mode in ("RGBA", "LA", "P"):
+                img = img.convert("RGBA")
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel("A"))
+                img = background
+            else:
+                img = img.convert("RGB")
+        elif img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        tmp = f"{dst}.tmp"
+        if dst.endswith(".webp"):
+            img.save(tmp, format="WEBP", quality=THUMB_QUALITY, method=4)
+        else:
+            img.save(tmp, format="JPEG", quality=THUMB_QUALITY, optimize=True, progressive=True)
+        os.replace(tmp, dst)
+    return dst, os.path.getsize(dst)
+
+
+def generate_thumbnails(images_dir: Path, widths=THUMB_WIDTHS, fmt: str = None, workers: int = None) -> dict:
+    """
+    Buat thumbnail yang kurang/basi secara paralel + hapus yang yatim.
+    Tanpa Pillow tidak ada yang diubah: hasilnya berisi "error" dan card tetap pakai gambar asli.
+    """
+    if Image is None:
+        return {"generated": 0, "removed": 0, "bytes": 0, "workers": 0, "error": PILLOW_MISSING}
+    jobs, stale = plan_thumbnails(images_dir, widths, fmt)
+    for path in stale:
+        path.unlink()
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    if workers == 1 or len(jobs) < 2:
+        results = [render_thumbnail(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(render_thumbnail, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    return {
+        "generated": len(results),
+        "removed": len(stale),
+        "bytes": sum(size for _, size in results),
+        "workers": workers,
+    }